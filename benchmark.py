@@ -0,0 +1,242 @@
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+
+# Synthetic-scale benchmark for portfolio.py. Each dataset is a complete source folder (content,
+# templates, images, PDFs) with N bilingual projects; it is built from scratch, rebuilt with no
+# changes and rebuilt after editing one project. Timings, peak memory and output bytes come from
+# the build's own --trace file. Results are saved as JSON and compared against a baseline run.
+SCRIPT_PATH = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_THRESHOLD = 10  # percent
+COMPARED_METRICS = ("seconds", "peak_rss", "output_bytes")
+
+# Names build_website's configuration refers to, so every dataset resolves without --allow-missing
+FEATURED_IDS = ["transcending", "bussen", "sorte-boks"]
+PROFILE_IMAGES = ["Profile.png", "Profile 2.jpeg"]
+CERTIFICATE_PDFS = ["CV - Thomas Julsgaard.pdf", "Thomas Julsgaard, BSc, Teknoantropologi [redacted CPR].pdf",
+                    "Tutor certificate 2023.pdf"]
+# Projects and roles share a handful of assets, so asset stages stay flat while content grows
+SHARED_ASSETS = 8
+
+WORDS = (
+    "analysis anthropology bridge collaboration community context data design digital energy ethics "
+    "experts fieldwork health infrastructure interview knowledge method mobility network policy practice "
+    "qualitative quantitative research science society study technology transport users values "
+    "analyse antropologi bro samarbejde fællesskab kontekst viden metode mobilitet netværk praksis "
+    "forskning videnskab samfund teknologi brugere værdier sundhed bæredygtighed kød øl måling"
+).split()
+TAGS = [
+    "Network Analysis", "Ethnography", "Interviews", "Surveys", "STS", "Energy", "Health", "Mobility",
+    "Policy", "Design", "Ethics", "Data Visualization", "Workshops", "Co-creation", "Scopus", "Epistemology",
+    "Fieldwork", "Innovation", "Sustainability", "Food", "Virtual Reality", "Public Sector", "Autonomy",
+    "Controversy Mapping", "Digital Methods", "User Involvement", "Governance", "Healthcare", "Transport",
+    "Infrastructure",
+]
+
+def sentence(rng, low, high):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(low, high))]
+    return " ".join(words).capitalize() + "."
+
+def title(rng, low, high):
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(low, high)))
+
+def png_bytes(width, height, seed):
+    # A plain RGB gradient; Pillow detects the format from the bytes, whatever the extension says
+    rows = []
+    for y in range(height):
+        row = bytearray(b"\0")
+        for x in range(width):
+            row += bytes(((x * 255 // width + seed * 37) % 256, (y * 255 // height + seed * 91) % 256, (seed * 53) % 256))
+        rows.append(bytes(row))
+    def chunk(tag, data):
+        return struct.pack("!I", len(data)) + tag + data + struct.pack("!I", zlib.crc32(tag + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack("!IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(b"".join(rows))) + chunk(b"IEND", b""))
+
+def pdf_bytes(text):
+    # One A4 page with a line of text, with a correct cross-reference table
+    stream = f"BT /F1 24 Tf 72 770 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<</Type/Catalog/Pages 2 0 R>>",
+        b"<</Type/Pages/Kids[3 0 R]/Count 1>>",
+        b"<</Type/Page/Parent 2 0 R/MediaBox[0 0 595 842]/Contents 4 0 R/Resources<</Font<</F1 5 0 R>>>>>>",
+        b"<</Length %d>>stream\n%s\nendstream" % (len(stream), stream),
+        b"<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>",
+    ]
+    out, offsets = bytearray(b"%PDF-1.4\n"), []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<</Size %d/Root 1 0 R>>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+def write_dataset(path, projects, experiences, competencies):
+    rng = random.Random(projects)
+    for folder in ("content/projects", "content/experiences", "images", "pdfs"):
+        os.makedirs(os.path.join(path, folder))
+    shutil.copytree(os.path.join(SCRIPT_PATH, "templates"), os.path.join(path, "templates"))
+
+    images = [f"Project image {i}.png" for i in range(SHARED_ASSETS)]
+    logos = [f"Logo {i}.png" for i in range(SHARED_ASSETS)]
+    pdfs = [f"Report {i}.pdf" for i in range(SHARED_ASSETS)]
+    for seed, name in enumerate(images + PROFILE_IMAGES):
+        with open(os.path.join(path, "images", name), "wb") as f:
+            f.write(png_bytes(640, 400, seed))
+    for seed, name in enumerate(logos):
+        with open(os.path.join(path, "images", name), "wb") as f:
+            f.write(png_bytes(240, 240, seed + 50))
+    for name in pdfs + CERTIFICATE_PDFS:
+        with open(os.path.join(path, "pdfs", name), "wb") as f:
+            f.write(pdf_bytes(name[:-4]))
+
+    width = len(str(projects))
+    for i in range(projects):
+        record = {
+            "id": FEATURED_IDS[i] if i < len(FEATURED_IDS) else f"project-{i}",
+            "title": title(rng, 3, 6), "subtitle": title(rng, 3, 6),
+            "img": images[i % SHARED_ASSETS], "pdf": pdfs[i % SHARED_ASSETS],
+            "tags": rng.sample(TAGS, rng.randint(2, 4)),
+            "summary": sentence(rng, 15, 25), "context": sentence(rng, 20, 35),
+            "methods": sentence(rng, 20, 35), "outcomes": sentence(rng, 20, 35),
+        }
+        with open(os.path.join(path, "content/projects", f"{i:0{width}d}-{record['id']}.json"), "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=4)
+    for i in range(experiences):
+        record = {
+            "id": f"role-{i}", "role_en": title(rng, 1, 3), "role_da": title(rng, 1, 3), "company": title(rng, 1, 2),
+            "period": f"Jan {2000 + i % 25} – Dec {2001 + i % 25}", "logo": logos[i % SHARED_ASSETS],
+            "desc_en": sentence(rng, 8, 14), "desc_da": sentence(rng, 8, 14),
+        }
+        with open(os.path.join(path, "content/experiences", f"{i:04d}-role-{i}.json"), "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False, indent=4)
+    with open(os.path.join(path, "content/competencies.json"), "w", encoding="utf-8") as f:
+        json.dump([{"en": title(rng, 2, 4), "da": title(rng, 2, 4)} for _ in range(competencies)], f, ensure_ascii=False, indent=4)
+
+def edit_one_project(path):
+    folder = os.path.join(path, "content/projects")
+    name = sorted(os.listdir(folder))[-1]
+    with open(os.path.join(folder, name), encoding="utf-8") as f:
+        record = json.load(f)
+    record["summary"] += " Edited for the benchmark."
+    with open(os.path.join(folder, name), "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=4)
+
+def run_build(source, output, trace_file, jobs):
+    # The cache sits next to the dataset, so each size starts cold and nothing outlives the run
+    command = [sys.executable, os.path.join(SCRIPT_PATH, "portfolio.py"), "--source", source, "--out", output,
+               "--cache-dir", source + "-cache", "--incremental", "--trace", trace_file]
+    if jobs:
+        command += ["--jobs", str(jobs)]
+    start = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        raise SystemExit(f"ERROR: build of {source} failed:\n{result.stdout}{result.stderr}")
+    with open(trace_file, encoding="utf-8") as f:
+        trace = json.load(f)
+    rss = [stage["peak_rss"] for stage in trace["stages"] if stage["peak_rss"] is not None]
+    return {
+        "seconds": round(sum(stage["ms"] for stage in trace["stages"]) / 1000, 4),
+        "wall_seconds": round(wall, 4),
+        "peak_rss": max(rss) if rss else None,
+        "bytes_written": sum(stage["bytes_written"] for stage in trace["stages"]),
+        "output_bytes": sum(trace["outputs"].values()),
+        "stages": {stage["name"]: round(stage["ms"], 2) for stage in trace["stages"]},
+    }
+
+def benchmark_size(work_dir, projects, jobs):
+    # Experiences and competencies grow alongside the projects, at a twentieth of the count
+    experiences, competencies = max(5, projects // 20), max(10, projects // 20)
+    source, output = os.path.join(work_dir, f"source-{projects}"), os.path.join(work_dir, f"site-{projects}")
+    write_dataset(source, projects, experiences, competencies)
+    result = {"projects": projects, "experiences": experiences, "competencies": competencies}
+    result["full"] = run_build(source, output, os.path.join(work_dir, f"trace-{projects}-full.json"), jobs)
+    result["incremental"] = run_build(source, output, os.path.join(work_dir, f"trace-{projects}-incremental.json"), jobs)
+    edit_one_project(source)
+    result["incremental_edit"] = run_build(source, output, os.path.join(work_dir, f"trace-{projects}-edit.json"), jobs)
+    return result
+
+def find_regressions(results, baseline, threshold):
+    previous = {entry["projects"]: entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        for run in ("full", "incremental", "incremental_edit"):
+            before = previous.get(entry["projects"], {}).get(run, {})
+            for metric in COMPARED_METRICS:
+                old, new = before.get(metric), entry[run][metric]
+                if old and new is not None and new > old * (1 + threshold / 100):
+                    regressions.append(f"{entry['projects']} projects, {run}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+def print_table(results):
+    print(f"{'Projects':>8} {'Run':<17} {'Build s':>8} {'Wall s':>8} {'Peak RSS MB':>12} {'Output MB':>10} {'Written MB':>11}")
+    for entry in results:
+        for run in ("full", "incremental", "incremental_edit"):
+            r = entry[run]
+            rss = f"{r['peak_rss'] / 1e6:12.1f}" if r["peak_rss"] is not None else f"{'-':>12}"
+            print(f"{entry['projects']:>8} {run:<17} {r['seconds']:8.2f} {r['wall_seconds']:8.2f} {rss} "
+                  f"{r['output_bytes'] / 1e6:10.2f} {r['bytes_written'] / 1e6:11.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark portfolio.py on synthetic datasets of increasing size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, metavar="N",
+                        help=f"project counts to benchmark (default {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument("--output", default="benchmark-results.json", help="where to save the results as JSON")
+    parser.add_argument("--baseline", help="earlier results to compare against; regressions make the exit status 1")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"percent increase that counts as a regression (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--jobs", type=int, metavar="N", help="passed on to portfolio.py --jobs")
+    parser.add_argument("--keep", action="store_true", help="keep the generated datasets and sites")
+    args = parser.parse_args()
+    if any(size < len(FEATURED_IDS) for size in args.sizes):
+        parser.error(f"sizes must be at least {len(FEATURED_IDS)}, the number of featured projects")
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"ERROR: could not read baseline {args.baseline}: {e}")
+
+    work_dir = tempfile.mkdtemp(prefix="portfolio-benchmark-")
+    results = []
+    try:
+        for size in args.sizes:
+            print(f"Benchmark: {size} projects...", flush=True)
+            results.append(benchmark_size(work_dir, size, args.jobs))
+    finally:
+        if args.keep:
+            print(f"Benchmark: datasets kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                   "platform": platform.platform(), "cpus": os.cpu_count(), "jobs": args.jobs, "results": results}, f, indent=1)
+    print_table(results)
+    print(f"Results: {args.output}")
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            raise SystemExit(1)
+        print(f"No regressions over {args.threshold:g}% against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
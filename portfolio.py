@@ -1,5 +1,71 @@
+import argparse
+import base64
+import ctypes.util
+import fnmatch
+import gzip
+import hashlib
+import io
+import json
 import os
+import pickle
+import posixpath
+import re
+import select
+import shutil
+import struct
+import sys
 import textwrap
+import threading
+import time
+import traceback
+import unicodedata
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html import unescape
+from html.parser import HTMLParser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows, publishing falls back to hard links/copies
+    fcntl = None
+
+try:
+    import brotli
+except ImportError:  # optional; without it only .gz siblings are produced
+    brotli = None
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:  # optional; without it pages use the system fallback fonts
+    subset = TTFont = instancer = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows, traces then leave out peak memory
+    resource = None
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, content files must be JSON
+    tomllib = None
+
+try:
+    import pikepdf
+except ImportError:  # optional; without it PDFs are published byte-for-byte
+    pikepdf = None
+
+try:
+    import pymupdf
+except ImportError:  # optional; without it projects need an explicit card image
+    pymupdf = None
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:  # Pillow is optional; without it images are referenced as-is
+    Image = ImageFilter = None
 
 def get_next_website_folder(base_path):
     counter = 1
@@ -10,17 +76,1547 @@ def get_next_website_folder(base_path):
             return full_path
         counter += 1
 
-def build_website():
+# --- CONTENT ---
+# Projects and roles live in content/, one JSON (or TOML) file each, ordered by filename.
+CONTENT_CACHE_NAME = "content.pickle"  # in the cache folder
+CONTENT_CACHE_VERSION = 1
+CONTENT_SCHEMAS = {
+    "projects": {"id": str, "title": str, "subtitle": str, "img": str, "pdf": str, "tags": list,
+                 "summary": str, "context": str, "methods": str, "outcomes": str},
+    "experiences": {"id": str, "role_en": str, "role_da": str, "company": str, "period": str,
+                    "logo": str, "desc_en": str, "desc_da": str},
+    "competencies": {"en": str, "da": str},
+}
+# Fields that may be left out; a project without 'img' uses the first page of its PDF
+CONTENT_OPTIONAL = {"projects": {"img"}}
+CONTENT_EXTENSIONS = (".json", ".toml")
+
+def parse_content_file(path):
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise ValueError("TOML content needs Python 3.11 or newer")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def validate_record(kind, record, source):
+    if not isinstance(record, dict):
+        return [f"{source}: expected an object"]
+    schema = CONTENT_SCHEMAS[kind]
+    errors = [f"{source}: unknown field '{field}'" for field in record if field not in schema]
+    for field, field_type in schema.items():
+        value = record.get(field)
+        if value in (None, "", []):
+            if field not in CONTENT_OPTIONAL.get(kind, ()):
+                errors.append(f"{source}: missing required field '{field}'")
+        elif not isinstance(value, field_type):
+            errors.append(f"{source}: '{field}' must be a {field_type.__name__}")
+        elif field_type is list and not all(isinstance(item, str) and item for item in value):
+            errors.append(f"{source}: '{field}' must only contain non-empty strings")
+    return errors
+
+def content_files(content_dir):
+    files = []
+    for kind in ("projects", "experiences"):
+        folder = os.path.join(content_dir, kind)
+        names = sorted(os.listdir(folder)) if os.path.isdir(folder) else []
+        files += [(kind, os.path.join(kind, name)) for name in names if name.endswith(CONTENT_EXTENSIONS)]
+    for ext in CONTENT_EXTENSIONS:
+        if os.path.isfile(os.path.join(content_dir, f"competencies{ext}")):
+            files.append(("competencies", f"competencies{ext}"))
+    return files
+
+def load_content(content_dir, cache_dir):
+    cache_file = os.path.join(cache_dir, CONTENT_CACHE_NAME)
+    try:
+        with open(cache_file, "rb") as f:
+            cache = pickle.load(f)
+        cached_files = cache["files"] if cache.get("version") == CONTENT_CACHE_VERSION else {}
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError, TypeError):
+        cached_files = {}
+
+    # Parsed and validated records are reused for every file whose mtime and size are unchanged
+    parsed_files = {}
+    content = {kind: [] for kind in CONTENT_SCHEMAS}
+    errors = []
+    for kind, relpath in content_files(content_dir):
+        stat = os.stat(os.path.join(content_dir, relpath))
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = cached_files.get(relpath)
+        if entry is None or entry["key"] != key:
+            try:
+                data = parse_content_file(os.path.join(content_dir, relpath))
+            except ValueError as e:
+                entry = {"key": key, "records": [], "errors": [f"{relpath}: {e}"]}
+            else:
+                items = data if kind == "competencies" and isinstance(data, list) else [data]
+                sources = [f"{relpath}[{i}]" for i in range(len(items))] if len(items) > 1 else [relpath]
+                entry = {"key": key, "records": items,
+                         "errors": [e for item, source in zip(items, sources) for e in validate_record(kind, item, source)]}
+        parsed_files[relpath] = entry
+        content[kind].extend(entry["records"])
+        errors.extend(entry["errors"])
+
+    for kind in ("projects", "experiences"):
+        seen = set()
+        for record in content[kind]:
+            if isinstance(record, dict) and record.get("id") in seen:
+                errors.append(f"{kind}: duplicate id '{record['id']}'")
+            seen.add(record.get("id") if isinstance(record, dict) else None)
+
+    if errors:
+        report = "\n".join(f"  - {e}" for e in errors)
+        raise SystemExit(f"ERROR: {len(errors)} problem(s) in {content_dir}, nothing was written:\n{report}")
+    # The caller saves the cache with save_content_cache() once the whole build has validated
+    cache_update = parsed_files if parsed_files != cached_files else None
+    return content["projects"], content["experiences"], content["competencies"], cache_update
+
+def save_content_cache(cache_dir, parsed_files):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, CONTENT_CACHE_NAME), "wb") as f:
+        pickle.dump({"version": CONTENT_CACHE_VERSION, "files": parsed_files}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+# --- TEMPLATES ---
+# Pages live in templates/ as HTML with {{ expression }} and {% for %} / {% if %} blocks.
+# Each file is compiled to Python once and renders into a list of parts that is joined at the end.
+TEMPLATE_TOKEN = re.compile(r"^[ \t]*\{%((?:(?!%\}).)+)%\}[ \t]*\n|\{%((?:(?!%\}).)+)%\}|\{\{((?:(?!\}\}).)+)\}\}", re.M)
+TEMPLATE_BLOCKS = {"for": "endfor", "if": "endif"}
+
+_compiled_templates = {}
+
+def compile_template(source, name):
+    code, blocks = ["__out = []", "__append = __out.append"], []
+    def emit(line, depth=0):
+        code.append("    " * (len(blocks) + depth) + line)
+
+    pos = 0
+    for match in TEMPLATE_TOKEN.finditer(source):
+        if match.start() > pos:
+            emit(f"__append({source[pos:match.start()]!r})")
+        pos = match.end()
+        if match[3] is not None:
+            emit(f"__append(str({match[3].strip()}))")
+            continue
+        # A block tag on a line of its own swallows that line, so loops don't leave blank lines behind
+        statement = (match[1] or match[2]).strip()
+        keyword = statement.split()[0]
+        if keyword in TEMPLATE_BLOCKS:
+            emit(f"{statement}:")
+            blocks.append(keyword)
+            emit("pass")
+        elif keyword in ("elif", "else") and blocks and blocks[-1] == "if":
+            emit(f"{statement}:", depth=-1)
+            emit("pass")
+        elif blocks and keyword == TEMPLATE_BLOCKS[blocks[-1]]:
+            blocks.pop()
+        else:
+            raise ValueError(f"unexpected {{% {statement} %}}")
+    if blocks:
+        raise ValueError(f"missing {{% {TEMPLATE_BLOCKS[blocks[-1]]} %}}")
+    if pos < len(source):
+        emit(f"__append({source[pos:]!r})")
+    return compile("\n".join(code), f"<template {name}>", "exec")
+
+def template_names(code):
+    # Every name the template (and comprehensions inside it) may look up
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_names"):
+            names |= template_names(const)
+    return names
+
+def load_template(path):
+    # Compiled code is kept until the file changes, so repeated builds in one process skip parsing
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _compiled_templates.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        try:
+            code = compile_template(source, os.path.basename(path))
+        except (SyntaxError, ValueError) as e:
+            raise SystemExit(f"ERROR: could not compile template {path}: {e}")
+        cached = (key, code, template_names(code), hashlib.sha256(source.encode("utf-8")).hexdigest())
+        _compiled_templates[path] = cached
+    return cached
+
+# A page rendered under a trace records what it read: templates, context names, and asset
+# helper calls with their results. Hashing what those read now gives the page's input key;
+# a page is rendered again only when its key differs from the one stored with it.
+_render_trace = None
+
+def record_dependency(kind, key, value=None):
+    if _render_trace is not None:
+        _render_trace[kind][key] = value
+
+def traced(render, *args, **params):
+    global _render_trace
+    outer, _render_trace = _render_trace, {"templates": {}, "names": {}, "assets": {}}
+    try:
+        return render(*args, **params), _render_trace
+    finally:
+        _render_trace = outer
+
+def merge_trace(trace):
+    if _render_trace is not None:
+        for kind, entries in trace.items():
+            _render_trace[kind].update(entries)
+
+class TemplateRenderer:
+    def __init__(self, template_dir, context):
+        self.template_dir = template_dir
+        self.context = context
+        self.fragments = {}
+        self.digests = {}
+
+    def render(self, name, **params):
+        _, code, names, digest = load_template(os.path.join(self.template_dir, name))
+        record_dependency("templates", name, digest)
+        for ref in names:
+            # Helpers are traced through the calls they make instead
+            if ref in self.context and ref not in params and not callable(self.context[ref]):
+                record_dependency("names", ref)
+        namespace = dict(self.context, include=self.include, **params)
+        exec(code, namespace)
+        return "".join(namespace["__out"])
+
+    def include(self, name, **params):
+        # Head, nav and footer only depend on their arguments within a build, so each variant renders once
+        key = (name, tuple(sorted(params.items())))
+        if key not in self.fragments:
+            self.fragments[key] = traced(self.render, name, **params)
+        html, trace = self.fragments[key]
+        merge_trace(trace)
+        return html
+
+    def context_digest(self, name):
+        if name not in self.digests:
+            self.digests[name] = hashlib.sha256(pickle.dumps(self.context.get(name), pickle.HIGHEST_PROTOCOL)).hexdigest()
+        return self.digests[name]
+
+    def input_key(self, template, params, trace, assets):
+        # Hash of the current state of everything a traced render read: template sources,
+        # context values, asset helper results (which carry the asset digests) and the parameters
+        inputs = [template, repr(sorted(params.items()))]
+        for name in sorted(trace["templates"]):
+            try:
+                inputs.append(f"{name} {load_template(os.path.join(self.template_dir, name))[3]}")
+            except OSError:
+                return None
+        inputs += [f"{name} {self.context_digest(name)}" for name in sorted(trace["names"])]
+        inputs += [repr((call, getattr(assets, call[0])(*call[1:]))) for call in sorted(trace["assets"], key=repr)]
+        return hashlib.sha256("\n".join(inputs).encode("utf-8")).hexdigest()
+
+# --- PARALLEL RENDERING ---
+# Pages don't depend on each other, so they render in worker processes. Each worker gets the
+# renderer once and keeps its own fragment cache.
+_worker_templates = None
+
+# Pages take a fraction of a millisecond each; below this many, starting worker processes costs
+# more than it saves and pages are rendered in this process
+PARALLEL_RENDER_MIN_PAGES = 500
+
+def init_render_worker(templates):
+    global _worker_templates
+    _worker_templates = templates
+
+def render_page(job, split_languages):
+    page, template, params = job
+    start_ns = time.perf_counter_ns()
+    html, trace = traced(_worker_templates.render, template, **params)
+    if not split_languages:
+        variants = [(page, html)]
+    else:
+        variants = [(f"{lang}/{page}", render_language_variant(html, lang, page)) for lang in LANGUAGES]
+    return variants, trace, (start_ns, time.perf_counter_ns(), os.getpid())
+
+def render_pages(templates, jobs_list, split_languages, jobs):
+    # jobs_list holds (output filename, template name, template parameters) per page;
+    # the result holds (rendered files, trace, timing) per page in the same order
+    workers = min(jobs, len(jobs_list))
+    if workers <= 1 or len(jobs_list) < PARALLEL_RENDER_MIN_PAGES:
+        init_render_worker(templates)
+        return [render_page(job, split_languages) for job in jobs_list]
+    with ProcessPoolExecutor(workers, initializer=init_render_worker, initargs=(templates,)) as pool:
+        # map() returns results in submission order, so the output never depends on scheduling
+        return list(pool.map(render_page, jobs_list, [split_languages] * len(jobs_list)))
+
+# --- IMAGE PIPELINE ---
+# Modern formats listed in the order the browser should prefer them
+IMAGE_FORMATS = [("avif", "image/avif", 50), ("webp", "image/webp", 80)]
+
+def slugify(filename):
+    stem = os.path.splitext(filename)[0].lower()
+    stem = stem.replace("æ", "ae").replace("ø", "o")
+    stem = unicodedata.normalize("NFKD", stem).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", stem).strip("-")
+
+def optimize_image(src_file, out_dir, widths, key):
+    os.makedirs(out_dir, exist_ok=True)
+    # The key fingerprints source bytes and settings, so variant names are safe to cache forever
+    slug = f"{slugify(os.path.basename(src_file))}.{key[:10]}"
+    Image.init()
+    formats = [f for f in IMAGE_FORMATS if f".{f[0]}" in Image.registered_extensions()]
+
+    with Image.open(src_file) as im:
+        im.load()
+        orig_w, orig_h = im.size
+        has_alpha = im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info)
+        if has_alpha:
+            im = im.convert("RGBA")
+            # An alpha channel that is fully opaque everywhere is treated as a photo
+            has_alpha = im.getchannel("A").getextrema()[0] < 255
+        im = im.convert("RGBA" if has_alpha else "RGB")
+
+        targets = sorted({w for w in widths if w < orig_w} or {orig_w})
+        info = {"width": 0, "height": 0, "sources": {mime: [] for _, mime, _ in formats}, "fallback": [], "bytes": 0}
+
+        for w in targets:
+            h = round(orig_h * w / orig_w)
+            resized = im if w == orig_w else im.resize((w, h), Image.LANCZOS)
+            for ext, mime, quality in formats:
+                name = f"{slug}.{w}.{ext}"
+                resized.save(os.path.join(out_dir, name), quality=quality)
+                info["sources"][mime].append((name, w))
+            # Transparent logos keep a PNG fallback, photos fall back to progressive JPEG
+            if has_alpha:
+                name = f"{slug}.{w}.png"
+                resized.save(os.path.join(out_dir, name), optimize=True)
+            else:
+                name = f"{slug}.{w}.jpg"
+                resized.save(os.path.join(out_dir, name), quality=82, optimize=True, progressive=True)
+            info["fallback"].append((name, w))
+            info["width"], info["height"] = w, h
+
+    for entries in list(info["sources"].values()) + [info["fallback"]]:
+        info["bytes"] += sum(os.path.getsize(os.path.join(out_dir, n)) for n, _ in entries)
+    return info
+
+def optimize_images(src_dir, out_dir, requests, cache):
+    variants = {}
+    if Image is None:
+        print("NOTE: Pillow not installed, images are referenced without responsive variants.")
+        return variants
+
+    src_bytes, out_bytes, reused = 0, 0, 0
+    for filename, widths in requests.items():
+        src_file = os.path.join(src_dir, filename)
+        if not os.path.isfile(src_file):
+            continue
+        # Variants only depend on the source bytes and the encoder settings
+        key = hashlib.sha256(f"{file_hash(src_file)}|{sorted(widths)}|{IMAGE_FORMATS}".encode("utf-8")).hexdigest()
+        cached = cache.get(filename)
+        if cached and cached["key"] == key and all(
+            os.path.exists(os.path.join(out_dir, name))
+            for entries in list(cached["info"]["sources"].values()) + [cached["info"]["fallback"]]
+            for name, _ in entries
+        ):
+            info = cached["info"]
+            reused += 1
+        else:
+            info = optimize_image(src_file, out_dir, widths, key)
+            record_bytes(info["bytes"])
+        cache[filename] = {"key": key, "info": info}
+        variants[filename] = info
+        src_bytes += os.path.getsize(src_file)
+        out_bytes += info["bytes"]
+
+    print(f"Images: {len(variants) - reused} optimized, {reused} reused, {src_bytes / 1e6:.1f} MB source -> {out_bytes / 1e6:.1f} MB across all variants")
+    return variants
+
+# Blurred previews shown as the <img> background until the real file arrives. They only
+# depend on the source bytes, so they are cached by source hash in the persistent cache folder.
+PLACEHOLDER_CACHE_NAME = "placeholders.json"  # in the cache folder
+PLACEHOLDER_CACHE_VERSION = 1
+PLACEHOLDER_WIDTH = 16
+
+def image_placeholder(src_file):
+    with Image.open(src_file) as im:
+        im.load()
+        # Transparent logos sit on the page background, a preview would only show up as a box
+        if im.mode in ("RGBA", "LA") or (im.mode == "P" and "transparency" in im.info):
+            if im.convert("RGBA").getchannel("A").getextrema()[0] < 255:
+                return None
+        im = im.convert("RGB")
+        height = max(1, round(im.height * PLACEHOLDER_WIDTH / im.width))
+        tiny = im.resize((PLACEHOLDER_WIDTH, height), Image.BOX).filter(ImageFilter.GaussianBlur(1))
+        color = "#{:02x}{:02x}{:02x}".format(*tiny.resize((1, 1), Image.BOX).getpixel((0, 0)))
+        buffer = io.BytesIO()
+        Image.init()
+        if ".webp" in Image.registered_extensions():
+            tiny.save(buffer, "WEBP", quality=30)
+            mime = "image/webp"
+        else:
+            tiny.save(buffer, "JPEG", quality=40)
+            mime = "image/jpeg"
+    data = base64.b64encode(buffer.getvalue()).decode("ascii")
+    # The dominant colour shows first and stays if the browser can't decode the preview
+    return f"background:{color} url(data:{mime};base64,{data}) center/cover no-repeat"
+
+def image_placeholders(src_dir, filenames, cache_dir):
+    cache_file = os.path.join(cache_dir, PLACEHOLDER_CACHE_NAME)
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+        cached = cache["placeholders"] if cache.get("version") == PLACEHOLDER_CACHE_VERSION else {}
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        cached = {}
+
+    placeholders, used = {}, {}
+    for filename in filenames:
+        digest = file_hash(os.path.join(src_dir, filename))
+        if digest in cached:
+            used[digest] = cached[digest]
+        else:
+            used[digest] = image_placeholder(os.path.join(src_dir, filename))
+        placeholders[filename] = used[digest]
+
+    if used != cached:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump({"version": PLACEHOLDER_CACHE_VERSION, "placeholders": used}, f, indent=1, sort_keys=True)
+    return placeholders
+
+# --- PDF PIPELINE ---
+# Optimized copies and thumbnails are stored under the source hash in the persistent cache
+# folder, so a PDF is only ever processed once.
+PDF_CACHE_DIR = "pdfs"                 # in the cache folder
+PDF_THUMBNAIL_DIR = "pdf-thumbnails"   # in the cache folder
+PDF_THUMBNAIL_WIDTH = 1200
+
+def optimize_pdf(src_file, cache_dir):
+    dest_file = os.path.join(cache_dir, f"{file_hash(src_file)}.pdf")
+    if not os.path.exists(dest_file):
+        os.makedirs(cache_dir, exist_ok=True)
+        # Linearized files show page 1 before the rest has arrived; only the stream encoding changes
+        with pikepdf.open(src_file) as pdf:
+            pdf.save(dest_file + ".tmp", linearize=True, compress_streams=True, recompress_flate=True,
+                     object_stream_mode=pikepdf.ObjectStreamMode.generate, deterministic_id=True)
+        os.replace(dest_file + ".tmp", dest_file)
+    return dest_file
+
+def pdf_thumbnail(src_file, cache_dir):
+    name = f"{slugify(os.path.basename(src_file))}.{file_hash(src_file)[:10]}.png"
+    dest_file = os.path.join(cache_dir, name)
+    if not os.path.exists(dest_file):
+        os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+        with pymupdf.open(src_file) as doc:
+            page = doc[0]
+            zoom = PDF_THUMBNAIL_WIDTH / page.rect.width
+            page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom)).save(dest_file)
+    # Absolute, so joining it onto images/ leaves it as is and it goes through the image pipeline
+    return os.path.abspath(dest_file)
+
+def remove_unused_cache_files(cache_dir, used):
+    if os.path.isdir(cache_dir):
+        for name in set(os.listdir(cache_dir)) - {os.path.basename(path) for path in used}:
+            os.remove(os.path.join(cache_dir, name))
+
+# --- BUILD TRACE ---
+# Wall time, peak memory and bytes written per stage, plus an event per rendered and written page.
+# --trace saves the events in Chrome's trace format (open in chrome://tracing or Perfetto) together
+# with the stage table and output sizes, so CI can pin a slowdown on a stage or a template.
+_build_trace = None
+
+def peak_rss():
+    # High-water mark of this process and of the finished render workers, in bytes
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024
+    return max(resource.getrusage(who).ru_maxrss for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)) * scale
+
+def record_bytes(count):
+    if _build_trace is not None:
+        _build_trace.count_bytes(count)
+
+class BuildTrace:
+    def __init__(self):
+        self.origin = time.perf_counter_ns()
+        self.events = []
+        self.stages = []
+        self.bytes_written = 0
+        self.lock = threading.Lock()
+        self.current = None
+
+    def count_bytes(self, count):
+        with self.lock:
+            self.bytes_written += count
+
+    def add_event(self, name, category, start_ns, end_ns, pid=None, tid=0, **args):
+        # perf_counter is a system-wide monotonic clock, so worker timestamps line up with ours
+        self.events.append({"name": name, "cat": category, "ph": "X", "pid": pid or os.getpid(), "tid": tid,
+                            "ts": (start_ns - self.origin) / 1000, "dur": (end_ns - start_ns) / 1000, "args": args})
+
+    def begin(self, name):
+        # Stages run back to back; starting one ends the previous
+        self.end()
+        self.current = (name, time.perf_counter_ns(), self.bytes_written)
+
+    def end(self):
+        if self.current is None:
+            return
+        name, start_ns, bytes_before = self.current
+        end_ns = time.perf_counter_ns()
+        written = self.bytes_written - bytes_before
+        rss = peak_rss()
+        self.add_event(name, "stage", start_ns, end_ns, bytes_written=written, peak_rss=rss)
+        self.stages.append({"name": name, "ms": (end_ns - start_ns) / 1e6, "peak_rss": rss, "bytes_written": written})
+        self.current = None
+
+    def summary(self, outputs_sizes):
+        rows = [f"{'Stage':<20} {'Time ms':>9} {'Peak RSS MB':>12} {'Written KB':>11}"]
+        for stage in self.stages:
+            rss = f"{stage['peak_rss'] / 1e6:12.1f}" if stage["peak_rss"] is not None else f"{'-':>12}"
+            rows.append(f"{stage['name']:<20} {stage['ms']:9.1f} {rss} {stage['bytes_written'] / 1024:11.1f}")
+        rows.append(f"{'total':<20} {sum(s['ms'] for s in self.stages):9.1f} {'':>12} {self.bytes_written / 1024:11.1f}")
+
+        renders = sorted((e for e in self.events if e["cat"] == "render"), key=lambda e: -e["dur"])
+        if renders:
+            rows.append("Slowest renders: " + ", ".join(f"{e['name']} {e['dur'] / 1000:.1f} ms" for e in renders[:5]))
+        groups = {}
+        for relpath, size in outputs_sizes.items():
+            group = relpath.split("/", 1)[0] + "/" if relpath.startswith(ASSET_DIRS) else os.path.splitext(relpath)[1] or relpath
+            groups[group] = groups.get(group, 0) + size
+        rows.append("Output: " + ", ".join(f"{group} {size / 1024:.1f} KB" for group, size in sorted(groups.items(), key=lambda g: -g[1])))
+        return "\n".join(rows)
+
+    def save(self, path, outputs_sizes):
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "build" if pid == os.getpid() else "render worker"}}
+                  for pid in sorted({e["pid"] for e in self.events})]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events + self.events, "displayTimeUnit": "ms",
+                       "stages": self.stages, "outputs": outputs_sizes}, f, indent=1)
+
+# --- INCREMENTAL BUILD ---
+MANIFEST_NAME = ".build-manifest.json"
+def default_cache_dir(source_path):
+    # Per user and per source tree, outside every output folder: fresh 'Website N' builds reuse it
+    # and it is never deployed with the site
+    root = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "portfolio", hashlib.sha256(os.path.abspath(source_path).encode("utf-8")).hexdigest()[:12])
+
+# Rendered pages with their input keys, finished page digests and the last stylesheet, so an
+# incremental build only renders and finishes what changed since the previous one
+RENDER_CACHE_NAME = "render-cache.pickle"  # in the cache folder
+
+def load_render_cache(cache_dir, flags):
+    # A cache from another version of this script or other build flags starts over
+    try:
+        with open(os.path.join(cache_dir, RENDER_CACHE_NAME), "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        cache = None
+    return cache if isinstance(cache, dict) and cache.get("flags") == flags else {"flags": flags}
+
+def save_render_cache(cache_dir, cache):
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, RENDER_CACHE_NAME), "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+_file_hashes = {}
+
+def file_hash(path):
+    # Several stages hash the same sources, so remember digests until the file changes
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        _file_hashes[key] = digest.hexdigest()
+    return _file_hashes[key]
+
+def load_manifest(base_path):
+    try:
+        with open(os.path.join(base_path, MANIFEST_NAME), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.setdefault("images", {})
+    manifest.setdefault("outputs", {})
+    return manifest
+
+def save_manifest(base_path, manifest):
+    with open(os.path.join(base_path, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True, ensure_ascii=False)
+
+def write_output(base_path, relpath, content, previous, current):
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    digest = hashlib.sha256(data).hexdigest()
+    current[relpath] = digest
+    target = os.path.join(base_path, relpath)
+    # Unchanged outputs are left alone so their mtime (and the CDN's ETag) stays stable
+    if previous.get(relpath) == digest and os.path.exists(target):
+        return False
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, "wb") as f:
+        f.write(data)
+    record_bytes(len(data))
+    return True
+
+def remove_stale_outputs(base_path, previous, current):
+    removed = 0
+    for relpath in previous:
+        target = os.path.join(base_path, relpath)
+        if relpath not in current and os.path.exists(target):
+            os.remove(target)
+            removed += 1
+    return removed
+
+# --- ASSET VALIDATION ---
+def normalize_filename(name):
+    # macOS stores 'å'/'ø' decomposed, data files and Windows use the composed form
+    return unicodedata.normalize("NFC", name)
+
+def build_asset_index(src_dir):
+    try:
+        names = os.listdir(src_dir)
+    except FileNotFoundError:
+        names = []
+    return {normalize_filename(name): name for name in names}
+
+def find_asset(index, filename):
+    found = index.get(normalize_filename(filename))
+    if found is not None:
+        return found, None
+    # Case-only mismatches work on Windows but 404 on the web server
+    folded = normalize_filename(filename).casefold()
+    hint = next((name for key, name in index.items() if key.casefold() == folded), None)
+    return None, hint
+
+def find_duplicate_assets(src_dir, index):
+    by_hash = {}
+    for name in sorted(index.values()):
+        path = os.path.join(src_dir, name)
+        if os.path.isfile(path):
+            by_hash.setdefault(file_hash(path), []).append(name)
+    # The first name in sort order is canonical, every other copy becomes an alias of it
+    groups = [names for names in by_hash.values() if len(names) > 1]
+    aliases = {alias: names[0] for names in groups for alias in names[1:]}
+    return aliases, groups
+
+# --- ASSET PUBLISHING ---
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones (btrfs, XFS)
+
+def link_or_copy(src_file, dest_file):
+    if fcntl is not None:
+        try:
+            with open(src_file, "rb") as src, open(dest_file, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            return "reflink"
+        except OSError:
+            os.remove(dest_file)
+    try:
+        os.link(src_file, dest_file)
+        return "hardlink"
+    except OSError:
+        shutil.copyfile(src_file, dest_file)
+        record_bytes(os.path.getsize(dest_file))
+        return "copy"
+
+def publish_asset(src_file, base_path, subdir, previous, current, name=None):
+    digest = file_hash(src_file)
+    name = name or os.path.basename(src_file)
+    ext = os.path.splitext(name)[1].lower()
+    relpath = f"{subdir}/{slugify(name)}.{digest[:10]}{ext}"
+    current[relpath] = digest
+    dest_file = os.path.join(base_path, relpath)
+    if previous.get(relpath) == digest and os.path.exists(dest_file):
+        return relpath, None
+    os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+    if os.path.exists(dest_file):
+        os.remove(dest_file)
+    return relpath, link_or_copy(src_file, dest_file)
+
+class PageAssets:
+    # URL and <picture> helpers for the templates; plain data so it can be sent to render workers
+    def __init__(self, asset_urls, image_variants, image_slots, placeholders, eager_slots):
+        self.asset_urls = asset_urls
+        self.image_variants = image_variants
+        self.image_slots = image_slots
+        self.placeholders = placeholders
+        self.eager_slots = eager_slots
+
+    def url(self, subdir, filename):
+        url = self.asset_urls.get(f"{subdir}/{filename}", f"{subdir}/{filename}")
+        record_dependency("assets", ("url", subdir, filename), url)
+        return url
+
+    def picture(self, filename, alt, img_class, slot, eager=False):
+        if not filename:
+            return ""
+        markup = self.picture_markup(filename, alt, img_class, slot, eager)
+        record_dependency("assets", ("picture", filename, alt, img_class, slot, eager), markup)
+        return markup
+
+    def picture_markup(self, filename, alt, img_class, slot, eager=False):
+        # eager marks a single image above the fold in a slot that is otherwise lazy
+        attrs = f'alt="{alt}" class="{img_class}"'
+        if eager:
+            attrs += ' fetchpriority="high"'
+        elif slot not in self.eager_slots:
+            attrs += ' loading="lazy" decoding="async"'
+        if self.placeholders.get(filename):
+            attrs += f' style="{self.placeholders[filename]}"'
+        info = self.image_variants.get(filename)
+        if not info:
+            return f'<img src="{self.url("images", filename)}" {attrs}>'
+
+        sizes = self.image_slots[slot][1]
+        def srcset(entries):
+            return ", ".join(f"images/{name} {w}w" for name, w in entries)
+
+        sources = "".join(
+            f'<source type="{mime}" srcset="{srcset(entries)}" sizes="{sizes}">'
+            for mime, entries in info["sources"].items()
+        )
+        fallback = info["fallback"]
+        return (
+            f'<picture>{sources}'
+            f'<img src="images/{fallback[-1][0]}" srcset="{srcset(fallback)}" sizes="{sizes}" '
+            f'width="{info["width"]}" height="{info["height"]}" {attrs}>'
+            f'</picture>'
+        )
+
+# --- HTML MINIFICATION ---
+# Whitespace next to these block-level and head-only tags never renders, so it can be dropped;
+# around inline elements (img, button, label, ...) it is only collapsed to a single space
+BLOCK_TAGS = (
+    "html|head|body|meta|title|link|script|style|noscript|main|header|footer|nav|section|article|div|"
+    "h[1-6]|p|form|ul|ol|li"
+)
+PROTECTED_BLOCK = re.compile(r"(<(pre|textarea|script|style)\b[^>]*>)(.*?)(</\2>)", re.S | re.I)
+
+def minify_script(code):
+    # Line-based so automatic semicolon insertion keeps working; only whole-line comments go
+    lines = (line.strip() for line in code.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def minify_style(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return re.sub(r"([{;][\w-]+):\s+", r"\1:", css).strip()
+
+def minify_markup(html):
+    html = re.sub(r"<!--(?!\[if).*?-->", "", html, flags=re.S)
+    html = re.sub(r"\s+", " ", html)
+    return re.sub(rf"\s*(</?(?:{BLOCK_TAGS})\b[^>]*>)\s*", r"\1", html, flags=re.I)
+
+def minify_html(html):
+    parts, last = [], 0
+    for match in PROTECTED_BLOCK.finditer(html):
+        parts.append(minify_markup(html[last:match.start()]))
+        open_tag, tag, body, close_tag = match.groups()
+        if tag.lower() == "script":
+            body = minify_script(body)
+        elif tag.lower() == "style":
+            body = minify_style(body)
+        # <pre> and <textarea> content is whitespace-sensitive and kept verbatim
+        parts.append(open_tag + body + close_tag)
+        last = match.end()
+    parts.append(minify_markup(html[last:]))
+    return "".join(parts).strip()
+
+# --- LANGUAGE VARIANTS ---
+# Build-time equivalent of setLang(): keeps one language's elements, drops the other's, and
+# turns the DA/EN toggle buttons into links to the sibling page.
+LANGUAGES = ("da", "en")
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+ASSET_DIRS = ("images/", "pdfs/", "css/", "fonts/", "search/")
+LANG_SWITCH_CLASSES = {
+    True: "{pad} py-1 rounded-full transition-colors bg-stone-900 text-white",
+    False: "{pad} py-1 rounded-full transition-colors text-stone-500 hover:text-stone-900",
+}
+
+def relocate_url(url, prefix):
+    return prefix + url if url.startswith(ASSET_DIRS) else url
+
+class LanguageFilter(HTMLParser):
+    def __init__(self, lang, page, prefix):
+        super().__init__(convert_charrefs=False)
+        self.lang, self.page, self.prefix = lang, page, prefix
+        self.out = []
+        self.skip_depth = 0
+        self.open_tags = []  # (tag, emitted) for every open non-void element
+
+    def render_tag(self, tag, attrs, close=""):
+        rendered = "".join(f' {k}' if v is None else f' {k}="{v.replace("&", "&amp;").replace(chr(34), "&quot;")}"' for k, v in attrs)
+        return f"<{tag}{rendered}{close}>"
+
+    def rewrite(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if f"lang-{self.lang}" in classes:
+            # Same as setLang(): the visible language loses its marker and 'hidden'
+            classes = [c for c in classes if c not in (f"lang-{self.lang}", "hidden")]
+            if not classes and tag == "span" and len(attrs) == 1:
+                return None
+            attrs["class"] = " ".join(classes)
+            if not classes:
+                del attrs["class"]
+        if tag == "html":
+            attrs["lang"] = self.lang
+            attrs["data-lang"] = self.lang
+        switch = re.fullmatch(r"setLang\('(\w+)'\)", attrs.get("onclick") or "")
+        if tag == "button" and switch:
+            target = switch[1]
+            pad = "px-2" if attrs.get("id", "").endswith("-mob") else "px-3"
+            return "a", {"href": f"../{target}/{self.page}", "hreflang": target, "lang": target,
+                         "class": LANG_SWITCH_CLASSES[target == self.lang].format(pad=pad)}
+        for key in ("href", "src", "data-src"):
+            if attrs.get(key):
+                attrs[key] = relocate_url(attrs[key], self.prefix)
+        if attrs.get("srcset"):
+            attrs["srcset"] = ", ".join(relocate_url(entry, self.prefix) for entry in attrs["srcset"].split(", "))
+        if attrs.get("onclick"):
+            attrs["onclick"] = re.sub(r"window\.open\('([^']+)'", lambda m: f"window.open('{relocate_url(m[1], self.prefix)}'", attrs["onclick"])
+        return tag, attrs
+
+    def handle_starttag(self, tag, attrs):
+        classes = (dict(attrs).get("class") or "").split()
+        if self.skip_depth or any(c.startswith("lang-") and c != f"lang-{self.lang}" for c in classes):
+            if tag not in VOID_TAGS:
+                self.skip_depth += 1
+            return
+        raw = self.get_starttag_text()
+        result = self.rewrite(tag, attrs)
+        if result is None:
+            self.open_tags.append((tag, None))
+            return
+        new_tag, new_attrs = result
+        if new_tag != tag or new_attrs != dict(attrs):
+            raw = self.render_tag(new_tag, new_attrs.items())
+        if tag not in VOID_TAGS:
+            self.open_tags.append((tag, new_tag))
+        self.out.append(raw)
+
+    def handle_startendtag(self, tag, attrs):
+        if not self.skip_depth:
+            self.out.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self.skip_depth:
+            if tag not in VOID_TAGS:
+                self.skip_depth -= 1
+            return
+        if tag == "head":
+            for lang in LANGUAGES:
+                self.out.append(f'<link rel="alternate" hreflang="{lang}" href="../{lang}/{self.page}">')
+            self.out.append(f'<link rel="alternate" hreflang="x-default" href="../{self.page}">')
+        emitted = tag
+        while self.open_tags:
+            open_tag, emitted = self.open_tags.pop()
+            if open_tag == tag:
+                break
+        if emitted is not None:
+            self.out.append(f"</{emitted}>")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.out.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f"&{name};")
+
+    def handle_charref(self, name):
+        self.handle_data(f"&#{name};")
+
+    def handle_comment(self, data):
+        self.handle_data(f"<!--{data}-->")
+
+    def handle_decl(self, decl):
+        self.handle_data(f"<!{decl}>")
+
+def render_language_variant(html, lang, page):
+    parser = LanguageFilter(lang, page, "../")
+    parser.feed(html)
+    parser.close()
+    return "".join(parser.out)
+
+def language_redirect_page(page, default_lang):
+    # Keeps old single-folder URLs (including #anchors) working after the split
+    return textwrap.dedent(f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <meta http-equiv="refresh" content="0; url={default_lang}/{page}">
+        {"".join(f'<link rel="alternate" hreflang="{lang}" href="{lang}/{page}">' for lang in LANGUAGES)}
+        <script>location.replace((sessionStorage.getItem('preferredLang') || '{default_lang}') + '/{page}' + location.hash);</script>
+    </head>
+    <body><a href="{default_lang}/{page}">{page}</a></body>
+    </html>
+    """).strip()
+
+# --- SEARCH INDEX ---
+# Inverted index for the case-study search box: a root file with the result list and tag
+# postings, plus one shard of sorted words per first letter that the page fetches on demand.
+SEARCH_FIELDS = ("title", "subtitle", "summary", "tags")
+
+def search_tokens(text):
+    # Must match fold() in the search script: lowercase, æ/ø spelled out, accents dropped
+    text = unescape(re.sub(r"<[^>]+>", " ", text)).lower().replace("æ", "ae").replace("ø", "o")
+    text = re.sub(r"[\u0300-\u036f]", "", unicodedata.normalize("NFKD", text))
+    return [token for token in re.findall(r"[a-z0-9]+", text) if len(token) > 1]
+
+def search_file(name, data):
+    text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"{name}.{hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]}.json", text
+
+def build_search_index(projects, urls):
+    docs, tags, postings = [], {}, {}
+    for doc, p in enumerate(projects):
+        docs.append([p["title"], p["subtitle"], urls[p["id"]]])
+        for tag in p["tags"]:
+            tags.setdefault(tag, []).append(doc)
+        words = set()
+        for field in SEARCH_FIELDS:
+            for value in (p[field] if isinstance(p[field], list) else [p[field]]):
+                words.update(search_tokens(value))
+        for word in words:
+            postings.setdefault(word, []).append(doc)
+
+    shards = {}
+    for word in sorted(postings):
+        shard = shards.setdefault(word[0], {"t": [], "p": []})
+        shard["t"].append(word)
+        shard["p"].append(postings[word])
+
+    files, shard_names = {}, {}
+    for key, shard in sorted(shards.items()):
+        name, text = search_file(key, shard)
+        files[f"search/{name}"] = text
+        shard_names[key] = name
+    name, text = search_file("index", {"docs": docs, "tags": tags, "shards": shard_names})
+    files[f"search/{name}"] = text
+    return f"search/{name}", files
+
+# --- PRECOMPRESSION ---
+COMPRESSIBLE_EXTENSIONS = (".html", ".css", ".js", ".json", ".svg", ".xml")
+COMPRESSION_SUFFIXES = (".br", ".gz")
+# A sibling must be at least this much smaller than the original to be worth serving
+COMPRESSION_MIN_SAVING = 0.1
+
+def compress_file(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    encoders = {".gz": lambda d: gzip.compress(d, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders[".br"] = lambda d: brotli.compress(d, quality=11)
+
+    sizes = {}
+    for suffix, encode in encoders.items():
+        compressed = encode(data)
+        if len(compressed) > len(data) * (1 - COMPRESSION_MIN_SAVING):
+            continue
+        with open(path + suffix, "wb") as f:
+            f.write(compressed)
+        record_bytes(len(compressed))
+        sizes[suffix] = len(compressed)
+    return len(data), sizes
+
+def precompress_outputs(base_path, relpaths):
+    # zlib and brotli release the GIL while compressing, so threads run in parallel
+    with ThreadPoolExecutor() as pool:
+        results = pool.map(lambda relpath: compress_file(os.path.join(base_path, relpath)), relpaths)
+        return dict(zip(relpaths, results))
+
+# --- WEB FONTS ---
+# Self-hosted replacement for Google Fonts. Source files are read from fonts/ next to this
+# script, one static file per weight named like 'Inter-400.ttf' or 'SpaceGrotesk-700.ttf'.
+# 'python portfolio.py --fetch-fonts' downloads the OFL-licensed variable fonts from the
+# google/fonts repository and saves a static instance per weight, with the license text.
+FONT_PLACEHOLDER = "__FONT_LINKS__"
+FONT_FAMILIES = {"Inter": [300, 400, 500, 600, 800], "Space Grotesk": [400, 500, 700]}
+FONT_DOWNLOADS = {
+    "Inter": "https://raw.githubusercontent.com/google/fonts/main/ofl/inter/Inter%5Bopsz,wght%5D.ttf",
+    "Space Grotesk": "https://raw.githubusercontent.com/google/fonts/main/ofl/spacegrotesk/SpaceGrotesk%5Bwght%5D.ttf",
+}
+# Body copy and the hero heading render above the fold on every page
+FONT_PRELOADS = [("Inter", 400), ("Inter", 800)]
+GOOGLE_FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;800'
+    '&family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">'
+)
+
+def fetch_fonts(fonts_dir):
+    if instancer is None:
+        raise SystemExit("ERROR: --fetch-fonts needs fontTools (pip install fonttools)")
+    os.makedirs(fonts_dir, exist_ok=True)
+    for family, url in FONT_DOWNLOADS.items():
+        stem = family.replace(" ", "")
+        downloads = {}
+        for name, file_url in [("font", url), ("license", url.rsplit("/", 1)[0] + "/OFL.txt")]:
+            try:
+                with urllib.request.urlopen(file_url, timeout=60) as response:
+                    downloads[name] = response.read()
+            except OSError as e:
+                raise SystemExit(f"ERROR: could not download {file_url}: {e}")
+        with open(os.path.join(fonts_dir, f"{stem}-OFL.txt"), "wb") as f:
+            f.write(downloads["license"])
+        for weight in FONT_FAMILIES[family]:
+            font = TTFont(io.BytesIO(downloads["font"]))
+            # None pins an axis at its default, so every axis but the weight is dropped
+            axes = {axis.axisTag: None for axis in font["fvar"].axes}
+            axes["wght"] = weight
+            instancer.instantiateVariableFont(font, axes).save(os.path.join(fonts_dir, f"{stem}-{weight}.ttf"))
+        print(f"Fonts: {family} {', '.join(map(str, FONT_FAMILIES[family]))} saved to {fonts_dir}")
+
+def find_font_source(fonts_dir, family, weight):
+    stem = f"{family.replace(' ', '')}-{weight}"
+    for ext in (".ttf", ".otf", ".woff2", ".woff"):
+        path = os.path.join(fonts_dir, stem + ext)
+        if os.path.isfile(path):
+            return path
+    return None
+
+def page_characters(pages):
+    # Printable ASCII is always kept so text typed into the contact form uses the same face
+    chars = {chr(c) for c in range(0x20, 0x7f)}
+    for page in pages:
+        text = re.sub(r"<(script|style)\b.*?</\1>", " ", page, flags=re.S | re.I)
+        text = unescape(re.sub(r"<[^>]+>", " ", text))
+        chars.update(c for c in text if c.isprintable())
+    return "".join(sorted(chars))
+
+def unicode_range(chars):
+    ranges = []
+    for cp in sorted(ord(c) for c in chars):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+    return ",".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in ranges)
+
+def subset_font(src_file, chars):
+    options = subset.Options()
+    options.flavor = "woff2" if brotli is not None else "woff"
+    font = subset.load_font(src_file, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=chars)
+    subsetter.subset(font)
+    buffer = io.BytesIO()
+    subset.save_font(font, buffer, options)
+    return buffer.getvalue()
+
+# --- STYLESHEET ---
+# Build-time replacement for the Tailwind CDN: only the utilities that appear in the
+# rendered pages are compiled, using the palette and fonts the inline config extended.
+STYLESHEET_PLACEHOLDER = "__STYLESHEET_HREF__"
+
+TW_PALETTE = {
+    "stone": {50: "#fafaf9", 100: "#f5f5f4", 200: "#e7e5e4", 300: "#d6d3d1", 400: "#a8a29e",
+              500: "#78716c", 600: "#57534e", 700: "#44403c", 800: "#292524", 900: "#1c1917"},
+    "teal": {50: "#f0fdfa", 100: "#ccfbf1", 200: "#99f6e4", 300: "#5eead4", 400: "#2dd4bf",
+             500: "#14b8a6", 600: "#0d9488", 700: "#0f766e", 800: "#115e59", 900: "#134e4a"},
+}
+TW_COLORS = {"white": "#ffffff", "black": "#000000"}
+TW_COLORS.update({f"{family}-{shade}": value for family, shades in TW_PALETTE.items() for shade, value in shades.items()})
+
+TW_SCREENS = {"sm": "640px", "md": "768px", "lg": "1024px"}
+TW_PSEUDO = {"hover": ":hover", "focus": ":focus", "last": ":last-child"}
+TW_FONT_FAMILY = {"sans": "'Inter', sans-serif", "mono": "'Space Grotesk', monospace"}
+TW_FONT_SIZE = {
+    "xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+    "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+    "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"), "5xl": ("3rem", "1"), "6xl": ("3.75rem", "1"),
+}
+TW_FONT_WEIGHT = {"light": 300, "normal": 400, "medium": 500, "semibold": 600, "bold": 700, "extrabold": 800}
+TW_LEADING = {"none": "1", "tight": "1.25", "snug": "1.375", "normal": "1.5", "relaxed": "1.625", "loose": "2"}
+TW_TRACKING = {"tighter": "-0.05em", "tight": "-0.025em", "normal": "0em", "wide": "0.025em", "wider": "0.05em", "widest": "0.1em"}
+TW_MAX_WIDTH = {
+    "xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem", "xl": "36rem", "2xl": "42rem",
+    "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem", "full": "100%", "none": "none",
+}
+TW_RADIUS = {"": "0.25rem", "sm": "0.125rem", "md": "0.375rem", "lg": "0.5rem", "xl": "0.75rem", "2xl": "1rem", "full": "9999px"}
+TW_SHADOW = {
+    "sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+    "": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+    "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+    "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+    "xl": "0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+    "2xl": "0 25px 50px -12px rgb(0 0 0 / 0.25)",
+}
+TW_ANIMATION = {"fade-up": "fadeUp 0.8s ease-out forwards"}
+TW_KEYFRAMES = (
+    "@keyframes fadeUp{0%{opacity:0;transform:translateY(15px)}100%{opacity:1;transform:translateY(0)}}"
+    "@keyframes popOut{0%{transform:scale(1)}40%{transform:scale(1.15)}100%{transform:scale(0);opacity:0}}"
+)
+TW_TRANSFORM = "transform:translate(var(--tw-translate-x),var(--tw-translate-y)) scale(var(--tw-scale-x),var(--tw-scale-y))"
+TW_TRANSITION = {
+    "": "color,background-color,border-color,text-decoration-color,fill,stroke,opacity,box-shadow,transform,filter,backdrop-filter",
+    "all": "all",
+    "colors": "color,background-color,border-color,text-decoration-color,fill,stroke",
+    "opacity": "opacity",
+    "transform": "transform",
+}
+TW_PREFLIGHT = (
+    "*,::before,::after{box-sizing:border-box;border-width:0;border-style:solid;border-color:#e5e7eb;"
+    "--tw-translate-x:0;--tw-translate-y:0;--tw-scale-x:1;--tw-scale-y:1}"
+    f"html{{line-height:1.5;-webkit-text-size-adjust:100%;tab-size:4;font-family:{TW_FONT_FAMILY['sans']}}}"
+    "body{margin:0;line-height:inherit}"
+    "h1,h2,h3,h4,h5,h6{font-size:inherit;font-weight:inherit}"
+    "a{color:inherit;text-decoration:inherit}"
+    "b,strong{font-weight:bolder}"
+    "button,input,select,textarea{font-family:inherit;font-size:100%;font-weight:inherit;line-height:inherit;color:inherit;margin:0;padding:0}"
+    "button,select{text-transform:none}"
+    "button,[type='button'],[type='reset'],[type='submit']{-webkit-appearance:button;background-color:transparent;background-image:none}"
+    "blockquote,dl,dd,h1,h2,h3,h4,h5,h6,hr,figure,p,pre{margin:0}"
+    "ol,ul,menu{list-style:none;margin:0;padding:0}"
+    "textarea{resize:vertical}"
+    "input::placeholder,textarea::placeholder{opacity:1;color:#9ca3af}"
+    "button,[role='button']{cursor:pointer}"
+    "img,svg,video,canvas,audio,iframe,embed,object{display:block;vertical-align:middle}"
+    "img,video{max-width:100%;height:auto}"
+    "[hidden]{display:none}"
+)
+
+def tw_color(value):
+    name, _, alpha = value.partition("/")
+    if name in ("transparent", "current"):
+        return "transparent" if name == "transparent" else "currentColor"
+    hex_value = TW_COLORS.get(name)
+    if hex_value is None or not alpha:
+        return hex_value
+    r, g, b = (int(hex_value[i:i + 2], 16) for i in (1, 3, 5))
+    return f"rgb({r} {g} {b} / {int(alpha) / 100:g})"
+
+def tw_length(value, negative=False):
+    if value.startswith("[") and value.endswith("]"):
+        length = value[1:-1]
+    elif value == "px":
+        length = "1px"
+    elif value == "0":
+        length = "0px"
+    elif value in ("auto", "full", "screen"):
+        length = {"auto": "auto", "full": "100%", "screen": "100vh"}[value]
+    elif re.fullmatch(r"\d+/\d+", value):
+        num, den = value.split("/")
+        length = f"{int(num) / int(den) * 100:g}%"
+    elif re.fullmatch(r"\d+(\.5)?", value):
+        length = f"{float(value) * 0.25:g}rem"
+    else:
+        return None
+    return f"-{length}" if negative and length != "auto" else length
+
+def tw_sides(prop, sides, value):
+    length = tw_length(value.lstrip("-"), value.startswith("-"))
+    if length is None:
+        return None
+    names = {"": [""], "x": ["-left", "-right"], "y": ["-top", "-bottom"],
+             "t": ["-top"], "b": ["-bottom"], "l": ["-left"], "r": ["-right"]}[sides]
+    return ";".join(f"{prop}{n}:{length}" for n in names)
+
+def tw_border_width(side, width):
+    names = {"": "border-width", "t": "border-top-width", "b": "border-bottom-width",
+             "l": "border-left-width", "r": "border-right-width"}
+    return f"{names[side]}:{width or 1}px"
+
+# Ordered utility table; the position of a rule decides its place in the cascade
+TW_UTILITIES = [
+    (r"(block|inline-block|inline-flex|flex|grid|contents)", lambda m: f"display:{m[1]}"),
+    (r"hidden", lambda m: "display:none"),
+    (r"(absolute|relative|fixed|sticky)", lambda m: f"position:{m[1]}"),
+    (r"inset-(.+)", lambda m: tw_sides("inset", "", m[1])),
+    (r"(-?)(top|bottom|left|right)-(.+)", lambda m: (l := tw_length(m[3], bool(m[1]))) and f"{m[2]}:{l}"),
+    (r"z-(\d+)", lambda m: f"z-index:{m[1]}"),
+    (r"order-(\d+)", lambda m: f"order:{m[1]}"),
+    (r"col-span-(\d+)", lambda m: f"grid-column:span {m[1]} / span {m[1]}"),
+    (r"m([xytblr]?)-(-?.+)", lambda m: tw_sides("margin", m[1], m[2])),
+    (r"space-y-(.+)", lambda m: (l := tw_length(m[1])) and (f"margin-top:{l}", " > :not([hidden]) ~ :not([hidden])")),
+    (r"aspect-square", lambda m: "aspect-ratio:1 / 1"),
+    (r"aspect-\[(\d+)/(\d+)\]", lambda m: f"aspect-ratio:{m[1]} / {m[2]}"),
+    (r"h-(.+)", lambda m: (l := tw_length(m[1])) and f"height:{l}"),
+    (r"min-h-(.+)", lambda m: (l := tw_length(m[1])) and f"min-height:{l}"),
+    (r"w-(.+)", lambda m: (l := tw_length(m[1])) and f"width:{'100vw' if m[1] == 'screen' else l}"),
+    (r"min-w-(.+)", lambda m: (l := tw_length(m[1])) and f"min-width:{l}"),
+    (r"max-w-(.+)", lambda m: (l := TW_MAX_WIDTH.get(m[1]) or tw_length(m[1])) and f"max-width:{l}"),
+    (r"flex-grow", lambda m: "flex-grow:1"),
+    (r"shrink-0", lambda m: "flex-shrink:0"),
+    (r"flex-(row|col)", lambda m: f"flex-direction:{'column' if m[1] == 'col' else 'row'}"),
+    (r"flex-wrap", lambda m: "flex-wrap:wrap"),
+    (r"grid-cols-(\d+)", lambda m: f"grid-template-columns:repeat({m[1]},minmax(0,1fr))"),
+    (r"items-(start|end|center|baseline|stretch)", lambda m: f"align-items:{'flex-' * (m[1] in ('start', 'end'))}{m[1]}"),
+    (r"justify-(start|end|center|between)", lambda m: f"justify-content:{ {'start': 'flex-start', 'end': 'flex-end', 'between': 'space-between'}.get(m[1], m[1])}"),
+    (r"self-(start|end|center)", lambda m: f"align-self:{'flex-' * (m[1] in ('start', 'end'))}{m[1]}"),
+    (r"gap-(.+)", lambda m: (l := tw_length(m[1])) and f"gap:{l}"),
+    (r"overflow-(hidden|auto)", lambda m: f"overflow:{m[1]}"),
+    (r"truncate", lambda m: "overflow:hidden;text-overflow:ellipsis;white-space:nowrap"),
+    (r"whitespace-nowrap", lambda m: "white-space:nowrap"),
+    (r"rounded(?:-(.+))?", lambda m: (r := TW_RADIUS.get(m[1] or "")) and f"border-radius:{r}"),
+    (r"border(?:-(\d))?", lambda m: tw_border_width("", m[1])),
+    (r"border-([tblr])(?:-(\d))?", lambda m: tw_border_width(m[1], m[2])),
+    (r"border-(.+)", lambda m: (c := tw_color(m[1])) and f"border-color:{c}"),
+    (r"bg-gradient-to-r", lambda m: "background-image:linear-gradient(to right,var(--tw-gradient-stops))"),
+    (r"bg-(.+)", lambda m: (c := tw_color(m[1])) and f"background-color:{c}"),
+    (r"from-(.+)", lambda m: (c := tw_color(m[1])) and f"--tw-gradient-from:{c};--tw-gradient-to:transparent;--tw-gradient-stops:var(--tw-gradient-from),var(--tw-gradient-to)"),
+    (r"to-(.+)", lambda m: (c := tw_color(m[1])) and f"--tw-gradient-to:{c}"),
+    (r"bg-clip-text", lambda m: "-webkit-background-clip:text;background-clip:text"),
+    (r"object-(cover|contain)", lambda m: f"object-fit:{m[1]}"),
+    (r"p([xytblr]?)-(.+)", lambda m: tw_sides("padding", m[1], m[2])),
+    (r"text-(left|center|right)", lambda m: f"text-align:{m[1]}"),
+    (r"font-(sans|mono)", lambda m: f"font-family:{TW_FONT_FAMILY[m[1]]}"),
+    (r"text-(.+)", lambda m: (s := TW_FONT_SIZE.get(m[1])) and f"font-size:{s[0]};line-height:{s[1]}"),
+    (r"text-\[(.+)\]", lambda m: f"font-size:{m[1]}"),
+    (r"font-(.+)", lambda m: (w := TW_FONT_WEIGHT.get(m[1])) and f"font-weight:{w}"),
+    (r"(uppercase|lowercase)", lambda m: f"text-transform:{m[1]}"),
+    (r"italic", lambda m: "font-style:italic"),
+    (r"leading-(.+)", lambda m: (v := TW_LEADING.get(m[1])) and f"line-height:{v}"),
+    (r"tracking-(.+)", lambda m: (v := TW_TRACKING.get(m[1])) and f"letter-spacing:{v}"),
+    (r"text-(.+)", lambda m: (c := tw_color(m[1])) and f"color:{c}"),
+    (r"opacity-(\d+)", lambda m: f"opacity:{int(m[1]) / 100:g}"),
+    (r"shadow(?:-(.+))?", lambda m: (s := TW_SHADOW.get(m[1] or "")) and f"box-shadow:{s}"),
+    (r"outline-none", lambda m: "outline:2px solid transparent;outline-offset:2px"),
+    (r"filter", lambda m: ""),
+    (r"grayscale(-0)?", lambda m: f"filter:grayscale({'0' if m[1] else '100%'})"),
+    (r"backdrop-blur-md", lambda m: "-webkit-backdrop-filter:blur(12px);backdrop-filter:blur(12px)"),
+    (r"transition(?:-(.+))?", lambda m: (p := TW_TRANSITION.get(m[1] or "")) and f"transition-property:{p};transition-timing-function:cubic-bezier(0.4,0,0.2,1);transition-duration:150ms"),
+    (r"duration-(\d+)", lambda m: f"transition-duration:{m[1]}ms"),
+    (r"animate-(.+)", lambda m: (a := TW_ANIMATION.get(m[1])) and f"animation:{a}"),
+    (r"transform", lambda m: TW_TRANSFORM),
+    (r"(-?)translate-([xy])-(.+)", lambda m: (l := tw_length(m[3], bool(m[1]))) and f"--tw-translate-{m[2]}:{l};{TW_TRANSFORM}"),
+    (r"scale-(\d+)", lambda m: f"--tw-scale-x:{int(m[1]) / 100:g};--tw-scale-y:{int(m[1]) / 100:g};{TW_TRANSFORM}"),
+    (r"cursor-(pointer|default)", lambda m: f"cursor:{m[1]}"),
+    (r"scroll-mt-(.+)", lambda m: (l := tw_length(m[1])) and f"scroll-margin-top:{l}"),
+    (r"group", lambda m: ""),
+]
+
+_compiled_classes = {}
+
+def tw_compile_class(token):
+    *variants, base = token.split(":")
+    for rank, (pattern, handler) in enumerate(TW_UTILITIES):
+        match = re.fullmatch(pattern, base)
+        if match and (result := handler(match)) is not None:
+            break
+    else:
+        return None
+
+    decls, suffix = result if isinstance(result, tuple) else (result, "")
+    if not decls:
+        return "", (0, rank, token), ""
+
+    selector = "." + re.sub(r"([^a-zA-Z0-9_-])", r"\\\1", token)
+    screen = ""
+    for variant in variants:
+        if variant in TW_SCREENS:
+            screen = variant
+        elif variant in TW_PSEUDO:
+            selector += TW_PSEUDO[variant]
+        elif variant == "group-hover":
+            selector = ".group:hover " + selector
+        else:
+            return None
+    has_state = len(variants) > (1 if screen else 0)
+    return screen, (int(has_state), rank, token), f"{selector}{suffix}{{{decls}}}"
+
+def compile_stylesheet(pages, site_css=""):
+    # site_css holds hand-written rules; its classes are hooks, not utilities to compile
+    class_tokens, script_tokens = set(), set()
+    hook_classes = set(re.findall(r"\.([a-zA-Z][\w-]*)", site_css))
+    for html in pages:
+        for attr in re.findall(r'class="([^"]*)"', html):
+            class_tokens.update(attr.split())
+        for block in re.findall(r"<(?:script|style)[^>]*>(.*?)</(?:script|style)>", html, re.S):
+            hook_classes.update(re.findall(r"\.([a-zA-Z][\w-]*)", block))
+            for literal in re.findall(r"""['"]([^'"\n]*)['"]""", block):
+                script_tokens.update(literal.split())
+
+    rules = {screen: [] for screen in [""] + list(TW_SCREENS)}
+    unknown = []
+    for token in sorted(class_tokens | script_tokens):
+        # A class always compiles to the same rule, so rebuilds in one process only compile new ones
+        if token not in _compiled_classes:
+            _compiled_classes[token] = tw_compile_class(token)
+        compiled = _compiled_classes[token]
+        if compiled is None:
+            if token in class_tokens and token not in hook_classes:
+                unknown.append(token)
+            continue
+        screen, order, css = compiled
+        if css:
+            rules[screen].append((order, css))
+
+    css = TW_PREFLIGHT + TW_KEYFRAMES + site_css
+    for screen, entries in rules.items():
+        body = "".join(rule for _, rule in sorted(entries))
+        if screen and body:
+            body = f"@media (min-width:{TW_SCREENS[screen]}){{{body}}}"
+        css += body
+    return css, unknown
+
+# --- CRITICAL CSS ---
+# Each page inlines only the rules its first screen needs and loads the full stylesheet without
+# blocking render. The first screen is approximated by the first CRITICAL_ELEMENTS elements of <body>.
+# Classes that page scripts add later (.active on reveals, .open on the menu) count as present, so
+# their state rules are inlined too and revealed content doesn't wait for the full stylesheet.
+CRITICAL_CSS_PLACEHOLDER = "__CRITICAL_CSS__"
+CRITICAL_ELEMENTS = 120
+START_TAG = re.compile(r"""<[a-zA-Z][\w-]*((?:[^>"']|"[^"]*"|'[^']*')*)>""")
+SCRIPT_CLASSES = re.compile(r"""classList\.(?:add|remove|toggle|replace)\(([^)]*)\)|className\s*=\s*(['"])(.*?)\2""")
+
+def fold_tokens(html):
+    # ".class" and "#id" names seen above the fold or named by a script
+    tokens = set()
+    body = re.search(r"<body\b", html, re.I)
+    for count, match in enumerate(START_TAG.finditer(html, body.start() if body else 0)):
+        if count == CRITICAL_ELEMENTS:
+            break
+        for kind, name, value in re.findall(r"""(?:^|\s)(class|id)=(["'])(.*?)\2""", match[1]):
+            tokens.update(("." if kind == "class" else "#") + token for token in value.split())
+    for match in SCRIPT_CLASSES.finditer(html):
+        names = re.findall(r"""['"]([^'"]*)['"]""", match[1]) if match[1] is not None else [match[3]]
+        tokens.update("." + token for name in names for token in name.split())
+    return tokens
+
+def parse_css_rules(css):
+    # (prelude, body, nested rules) for each top-level block; only @media bodies are split further
+    rules, depth, start = [], 0, 0
+    for i, ch in enumerate(css):
+        if ch == "{":
+            if depth == 0:
+                prelude, body_start = css[start:i].strip(), i + 1
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                body = css[body_start:i]
+                rules.append((prelude, body, parse_css_rules(body) if prelude.startswith("@media") else None))
+                start = i + 1
+    return rules
+
+def selector_tokens(rules):
+    # Every class and id the rules refer to; pages differing only in other names share critical CSS
+    tokens = set()
+    for prelude, _, nested in rules:
+        if nested is not None:
+            tokens |= selector_tokens(nested)
+        else:
+            tokens.update(kind + re.sub(r"\\(.)", r"\1", name) for kind, name in re.findall(r"([.#])((?:\\.|[\w-])+)", prelude))
+    return tokens
+
+def selector_matches(selector, tokens):
+    # Element, attribute and pseudo parts always match; every class and id must be on the page
+    names = re.findall(r"([.#])((?:\\.|[\w-])+)", selector)
+    return all(kind + re.sub(r"\\(.)", r"\1", name) in tokens for kind, name in names)
+
+def critical_css(rules, tokens):
+    css = []
+    for prelude, body, nested in rules:
+        if nested is not None:
+            inner = critical_css(nested, tokens)
+            if inner:
+                css.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@") or any(selector_matches(s, tokens) for s in prelude.split(",")):
+            css.append(f"{prelude}{{{body}}}")
+    return "".join(css)
+
+# --- PAGE BUDGETS ---
+# Every written page is analysed statically: the images, stylesheets, scripts, preloads and CSS
+# fonts it loads are followed into the output folder and weighed as they are transferred, using
+# the smallest precompressed sibling where there is one. Limits come from budgets.json next to
+# the content; the first pattern in that file that matches a page applies to it.
+BUDGETS_FILE = "budgets.json"
+BUDGET_LIMITS = {"bytes": "transfer bytes", "requests": "requests", "third_party_origins": "third-party origins"}
+BUDGET_REPORT_ROWS = 8
+# Responsive images are weighed as a 1280px wide screen at 2x density would pick them
+BUDGET_VIEWPORT_WIDTH = 1280
+BUDGET_PIXEL_RATIO = 2
+
+def srcset_choice(srcset, sizes):
+    candidates = []
+    for candidate in srcset.split(","):
+        parts = candidate.split()
+        if parts:
+            candidates.append((int(parts[1][:-1]) if len(parts) > 1 and parts[1].endswith("w") else 0, parts[0]))
+    # The first 'sizes' entry whose (min-width) condition holds gives the slot width
+    slot = BUDGET_VIEWPORT_WIDTH
+    for entry in (sizes or "").split(","):
+        match = re.fullmatch(r"\s*(?:\(min-width:\s*(\d+)px\)\s*)?(\d+(?:\.\d+)?)(px|vw)\s*", entry)
+        if match and (match[1] is None or int(match[1]) <= BUDGET_VIEWPORT_WIDTH):
+            slot = float(match[2]) * (BUDGET_VIEWPORT_WIDTH / 100 if match[3] == "vw" else 1)
+            break
+    fitting = sorted(c for c in candidates if c[0] >= slot * BUDGET_PIXEL_RATIO)
+    return (fitting[0] if fitting else max(candidates))[1]
+
+class ResourceScanner(HTMLParser):
+    # Collects what a browser fetches to render the page, in document order
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.resources = {}
+        self.connections = set()
+        self.inline_css = []
+        self.in_style = False
+        self.in_picture = False
+        self.picture_resolved = False
+
+    def add(self, url, kind):
+        if url and not url.startswith(("data:", "#")):
+            self.resources.setdefault(url, kind)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "link":
+            rel = (attrs.get("rel") or "").lower().split()
+            if "preconnect" in rel or "dns-prefetch" in rel:
+                self.connections.add(attrs.get("href"))
+            elif "stylesheet" in rel or "icon" in rel or "preload" in rel or "modulepreload" in rel:
+                self.add(attrs.get("href"), attrs.get("as") or ("style" if "stylesheet" in rel else "other"))
+        elif tag == "script":
+            self.add(attrs.get("src"), "script")
+        elif tag == "style":
+            self.in_style = True
+        elif tag == "picture":
+            self.in_picture, self.picture_resolved = True, False
+        elif tag == "source" and self.in_picture and not self.picture_resolved and attrs.get("srcset"):
+            # Browsers use the first <source> whose type they support; ours lists the preferred format first
+            self.add(srcset_choice(attrs["srcset"], attrs.get("sizes")), "image")
+            self.picture_resolved = True
+        elif tag == "img" and not (self.in_picture and self.picture_resolved):
+            self.add(srcset_choice(attrs["srcset"], attrs.get("sizes")) if attrs.get("srcset") else attrs.get("src"), "image")
+
+    def handle_endtag(self, tag):
+        if tag == "style":
+            self.in_style = False
+        elif tag == "picture":
+            self.in_picture = False
+
+    def handle_data(self, data):
+        if self.in_style:
+            self.inline_css.append(data)
+
+def is_third_party(url):
+    return url.startswith(("http://", "https://", "//"))
+
+def url_origin(url):
+    return "/".join(url.split("/", 3)[:3])
+
+def transfer_size(base_path, relpath):
+    path = os.path.join(base_path, relpath)
+    sizes = [os.path.getsize(p) for p in [path] + [path + suffix for suffix in COMPRESSION_SUFFIXES] if os.path.isfile(p)]
+    return min(sizes) if sizes else None
+
+def css_urls(css):
+    return [u.strip("'\"") for u in re.findall(r"url\(([^)]+)\)", css) if not u.strip("'\"").startswith("data:")]
+
+def page_weight(base_path, page):
+    with open(os.path.join(base_path, page), encoding="utf-8") as f:
+        scanner = ResourceScanner()
+        scanner.feed(f.read())
+
+    def resolve(url, relative_to):
+        url = url.split("#", 1)[0].split("?", 1)[0] if not is_third_party(url) else url
+        return url if is_third_party(url) else posixpath.normpath(posixpath.join(posixpath.dirname(relative_to), url))
+
+    resources = {page: "document"}
+    for url, kind in scanner.resources.items():
+        resources.setdefault(resolve(url, page), kind)
+    for url in css_urls("".join(scanner.inline_css)):
+        resources.setdefault(resolve(url, page), "font" if url.endswith((".woff2", ".woff")) else "image")
+    # Fonts and images referenced from linked stylesheets load with the page too
+    for relpath in [r for r in resources if r.endswith(".css") and not is_third_party(r)]:
+        if os.path.isfile(os.path.join(base_path, relpath)):
+            with open(os.path.join(base_path, relpath), encoding="utf-8") as f:
+                for url in css_urls(f.read()):
+                    resources.setdefault(resolve(url, relpath), "font" if url.endswith((".woff2", ".woff")) else "image")
+
+    rows = [(relpath, kind, None if is_third_party(relpath) else transfer_size(base_path, relpath))
+            for relpath, kind in resources.items()]
+    origins = {url_origin(url) for url in list(resources) + [c for c in scanner.connections if c] if is_third_party(url)}
+    return {"bytes": sum(size or 0 for _, _, size in rows), "requests": len(rows),
+            "third_party_origins": len(origins), "rows": rows, "origins": sorted(origins)}
+
+def load_budgets(path):
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            budgets = json.load(f)
+    except ValueError as e:
+        raise SystemExit(f"ERROR: could not read {path}: {e}")
+    errors = [f"'{pattern}': unknown limit '{limit}'" for pattern, limits in budgets.items() for limit in limits
+              if limit not in BUDGET_LIMITS]
+    errors += [f"'{pattern}': '{limit}' must be a whole number" for pattern, limits in budgets.items()
+               for limit, value in limits.items() if not isinstance(value, int)]
+    if errors:
+        raise SystemExit(f"ERROR: {len(errors)} problem(s) in {path}:\n" + "\n".join(f"  - {e}" for e in errors))
+    return budgets
+
+def page_budget(budgets, page):
+    for pattern, limits in budgets.items():
+        if fnmatch.fnmatch(page, pattern) or fnmatch.fnmatch(posixpath.basename(page), pattern):
+            return limits
+    return {}
+
+def budget_report(page, weight, exceeded):
+    def amount(limit, value):
+        return f"{value / 1024:.1f} KB" if limit == "bytes" else str(value)
+    lines = [f"  {page}: " + ", ".join(f"{BUDGET_LIMITS[limit]} {amount(limit, weight[limit])} > {amount(limit, budget)}"
+                                       for limit, budget in exceeded)]
+    rows = sorted(weight["rows"], key=lambda row: -(row[2] or 0))
+    for relpath, kind, size in rows[:BUDGET_REPORT_ROWS]:
+        shown = "third-party" if is_third_party(relpath) else "missing" if size is None else f"{size / 1024:.1f} KB"
+        lines.append(f"      {kind:<9} {shown:>11}  {relpath}")
+    if len(rows) > BUDGET_REPORT_ROWS:
+        lines.append(f"      ... {len(rows) - BUDGET_REPORT_ROWS} smaller resource(s)")
+    if weight["origins"]:
+        lines.append(f"      third-party origins: {', '.join(weight['origins'])}")
+    return "\n".join(lines)
+
+# --- SERVICE WORKER ---
+# sw.js at the site root precaches the build's own outputs, so repeat visits and navigation
+# between pages need no network. Every change to a precached file gives the cache a new name.
+SERVICE_WORKER_PLACEHOLDER = "__SERVICE_WORKER_URL__"
+SERVICE_WORKER_FILE = "sw.js"
+SERVICE_WORKER_CACHE_PREFIX = "portfolio-"
+PRECACHE_DIRS = ("css/", "search/")
+
+def precache_list(base_path, outputs, image_files, pdf_size_cap):
+    urls = []
+    for relpath in sorted(outputs):
+        if relpath.endswith(COMPRESSION_SUFFIXES) or relpath == SERVICE_WORKER_FILE:
+            continue
+        if relpath.endswith(".html") or relpath.startswith(PRECACHE_DIRS) or relpath in image_files:
+            urls.append(relpath)
+        elif relpath.startswith("pdfs/") and pdf_size_cap is not None:
+            if os.path.getsize(os.path.join(base_path, relpath)) <= pdf_size_cap:
+                urls.append(relpath)
+    return urls
+
+def build_website(output_path=None, incremental=False, allow_missing=False, minify=False, split_languages=False, jobs=None, render_cache=None, precompress=True, trace_path=None, source_path=None, enforce_budgets=True, cache_path=None):
+    global _build_trace
+    _build_trace = trace = BuildTrace()
+
     # --- CONFIGURATION ---
     desktop_path = r"C:\Users\thoma\Desktop"
     
     if not os.path.exists(desktop_path):
         desktop_path = os.getcwd()
     
-    base_path = get_next_website_folder(desktop_path)
+    # Incremental builds reuse one stable folder, full builds get a fresh 'Website N'
+    if incremental:
+        base_path = output_path or os.path.join(desktop_path, "Website")
+    else:
+        base_path = output_path or get_next_website_folder(desktop_path)
+    jobs = jobs or os.cpu_count() or 1
     images_path = os.path.join(base_path, "images")
     pdfs_path = os.path.join(base_path, "pdfs")
     
+    # Source assets live next to this script unless another source folder is given
+    source_path = source_path or os.path.dirname(os.path.abspath(__file__))
+    cache_path = cache_path or default_cache_dir(source_path)
+    source_images_path = os.path.join(source_path, "images")
+    source_pdfs_path = os.path.join(source_path, "pdfs")
+    source_fonts_path = os.path.join(source_path, "fonts")
+    content_path = os.path.join(source_path, "content")
+    template_path = os.path.join(source_path, "templates")
+    
     user_name = "Thomas Julsgaard"
 
     # --- UI POSITIONING ---
@@ -36,878 +1632,745 @@ def build_website():
     profile_image_index = "Profile.png"       # Frontpage
     profile_image_profile = "Profile 2.jpeg"  # Profile Page
     
+    # Responsive variants: widths to generate and the 'sizes' hint per image slot
+    image_slots = {
+        "featured": ([400, 800, 1200], "(min-width: 1152px) 520px, (min-width: 768px) 50vw, 100vw"),
+        "card": ([400, 800], "(min-width: 1152px) 368px, (min-width: 768px) 33vw, 100vw"),
+        "logo": ([120, 240], "120px"),
+        "profile_index": ([480, 768, 1024], "(min-width: 768px) 448px, 100vw"),
+        "profile_page": ([480, 768, 1024], "(min-width: 1152px) 460px, (min-width: 768px) 42vw, 100vw"),
+        "thumb": ([96, 192, 256], "(min-width: 768px) 128px, 96px"),
+    }
+    
+    # Slots that are above the fold on their page load eagerly, the rest get loading="lazy"
+    eager_image_slots = {"profile_index", "profile_page", "card"}
+    # The first rows of listing thumbnails are above the fold too; they load eagerly at high priority
+    eager_listing_thumbnails = 4
+    
     # Filenames
     bsc_certificate_file = "Thomas Julsgaard, BSc, Teknoantropologi [redacted CPR].pdf"
     tutor_certificate_file = "Tutor certificate 2023.pdf"
     cv_file = "CV - Thomas Julsgaard.pdf"
     
+    # Used in place of missing files; leave as None to fail the build instead
+    missing_image_placeholder = None
+    missing_pdf_placeholder = None
+    
+    # Projects shown on the front page, by id
+    featured_project_ids = ["transcending", "bussen", "sorte-boks"]
+    
+    # Pages rendered from templates/, with their navigation labels (en, da)
+    pages = {
+        "index.html": ("Index", "Forside"),
+        "casestudies.html": ("Case Studies", "Case studier"),
+        "experience.html": ("Work Experience", "Arbejdserfaring"),
+        "profile.html": ("Profile", "Profil"),
+        "contact.html": ("Contact", "Kontakt")
+    }
+    
+    # Load fonts from Google when fonts/ can't be self-hosted; off so pages make no third-party requests
+    google_fonts_fallback = False
+
+    # Case studies listed per page of casestudies.html; further pages are casestudies-2.html, ...
+    case_studies_per_page = 12
+
+    # The service worker caches PDFs once opened; set a size in bytes to also precache PDFs up to that size
+    precache_pdf_size_cap = None
+
     # Social Links
     linkedin_url = "https://www.linkedin.com/in/thomasjulsgaard/"
     github_url = "https://github.com/T-Julsgaard"
     
-    # --- PROJECT DATA ---
-    projects = [
-        {
-            "id": "transcending",
-            "title": "Transcending the Disciplinary Divide",
-            "subtitle": "Digital Methods & Interactional Expertise",
-            "img": "Transcending the disciplinary divide.png",
-            "pdf": "Transcending the disciplinary divide.pdf",
-            "tags": ["Network Analysis", "Scopus", "Epistemology"],
-            "summary": "Investigating how digital methods can guide 'interactional expertise' to bridge gaps between distinct scientific disciplines.",
-            "context": "Interdisciplinary collaboration is crucial in post-normal science, yet experts often lack a shared language. We explored how to identify 'blind spots' between disciplines.",
-            "methods": "Co-occurrence network analysis of 1,500 Scopus articles on Bitcoin mining combined with qualitative expert group interviews with energy engineers.",
-            "outcomes": "Developed a method to visualize disciplinary heterogeneity, allowing Techno-Anthropologists to strategically target where 'bridges' need to be built between experts."
-        },
-        {
-            "id": "wegovy",
-            "title": "Wegovy: a matter of fa(c)t?",
-            "subtitle": "A Digital Ethnography",
-            "img": "Wegovy a matter of fact.png",
-            "pdf": "Wegovy a matter of fact.pdf",
-            "tags": ["Digital Methods", "Controversy Mapping", "ANT"],
-            "summary": "Tracing the socio-technical controversies of the weight-loss drug Wegovy across six different digital platforms.",
-            "context": "Wegovy is not just a medical molecule; it is a cultural phenomenon intervening in concepts of body image, economics, and health policy.",
-            "methods": "Scraped 150,000+ data points from Reddit, X, Mumsnet, and Scopus. Applied Actor-Network Theory (Latour's 'Matters of Concern') and network visualization.",
-            "outcomes": "Mapped how the 'fact' of Wegovy mutates across platforms—from a financial asset on X to a lifestyle struggle on Mumsnet—revealing it as a heterogenous network rather than a singular product."
-        },
-        {
-            "id": "sorte-boks",
-            "title": "Den sorte boks i den hvide verden",
-            "subtitle": "AI in Radiology: A Praxiographic Analysis",
-            "img": "Den sorte boks i den hvide verden.png",
-            "pdf": "Den sorte boks i den hvide verden.pdf",
-            "tags": ["Praxiography", "Clinical AI", "Healthcare"],
-            "summary": "An investigation into how Artificial Intelligence is practiced differently by developers, administrators, and clinicians.",
-            "context": "AI is often presented as a solution to healthcare pressure, but 'AI' means different things to a hospital director vs. a radiologist.",
-            "methods": "Praxiography (Annemarie Mol) based on interviews with actors from RAIT, Radiobotics, and Herlev-Gentofte Hospital.",
-            "outcomes": "Identified conflicting 'logics' (Market vs. Professional vs. Administrative). Developed a translation tool to help stakeholders align their expectations of AI implementation."
-        },
-        {
-            "id": "vr-sion",
-            "title": "Hvilken VR-sion af dig?",
-            "subtitle": "Virtual Ethnography in VRChat",
-            "img": "Hvilken VR-sion af dig.png",
-            "pdf": "Hvilken VR-sion af dig.pdf",
-            "tags": ["Virtual Ethnography", "Postphenomenology", "Identity"],
-            "summary": "Exploring how social identity and bodily experience are reconstructed inside the virtual worlds of VRChat.",
-            "context": "Social VR is not just a game but a space for identity formation, particularly for socially marginalized individuals.",
-            "methods": "Avatar-based ethnography and interviews within VRChat, analyzed through Verbeek’s postphenomenological framework.",
-            "outcomes": "Documented the phenomenon of 'Phantom Touch' and how users leverage virtual anonymity to perform and eventually integrate new aspects of new identity traits."
-        },
-        {
-            "id": "bussen",
-            "title": "Så kører bussen, selv",
-            "subtitle": "Participatory Technology Assessment",
-            "img": "Så kører bussen, selv.png",
-            "pdf": "Så kører bussen, selv.pdf",
-            "tags": ["Autonomous Vehicles", "Citizen Summit", "PTA"],
-            "summary": "A democratic assessment of self-driving buses, focusing on trust, safety, and social accessibility.",
-            "context": "The transition to autonomous public transport is often driven by technology, overlooking the social reality of the passengers.",
-            "methods": "Organized a 'Citizen Summit' (Borgertopmøde) combined with expert interviews (Movia, Holo) to facilitate democratic debate.",
-            "outcomes": "Concluded that passengers prioritize flexibility and cybersecurity over futuristic 'pods', recommending a gradual implementation strategy to build social trust."
-        },
-        {
-            "id": "plantebaseret",
-            "title": "Meningstilskrivelser af plantebaseret kød",
-            "subtitle": "Understanding Stigmatization",
-            "img": "Meningstilskrivelser af plantebaseret kød.png",
-            "pdf": "Meningstilskrivelser af plantebaseret kød.pdf",
-            "tags": ["Food Studies", "Mixed Methods", "Stigma"],
-            "summary": "Investigating the social stigma surrounding plant-based meat alternatives among Danish consumers.",
-            "context": "Despite climate goals, young Danes struggle to change dietary habits. We investigated the social friction of ordering 'fake meat'.",
-            "methods": "Mixed methods approach utilizing a quantitative survey (n=954) and qualitative semi-structured interviews.",
-            "outcomes": "Found a correlation between diet type and felt stigmatization. Omnivores associate meat with 'tradition' and 'masculinity', creating a social barrier for adopting plant-based alternatives."
-        }
-    ]
+    # --- CONTENT ---
+    trace.begin("content")
+    # Projects, experiences and competencies are loaded and validated from content/
+    projects, experiences, competencies_list, content_cache = load_content(content_path, cache_path)
+    projects_by_id = {p["id"]: p for p in projects}
+    unknown_featured = [pid for pid in featured_project_ids if pid not in projects_by_id]
+    if unknown_featured:
+        raise SystemExit(f"ERROR: featured_project_ids references unknown projects: {', '.join(unknown_featured)}")
+    featured_projects = [projects_by_id[pid] for pid in featured_project_ids]
 
-    # --- EXPERIENCE DATA ---
-    experiences = [
-        {
-            "role_en": "Co-founder", "role_da": "Medstifter",
-            "company": "Nordic Mining", "period": "Feb 2024 – Jul 2025",
-            "logo": "Nordic mining logo.png",
-            "desc_en": "Developed a model to assess the profitability of flexible data centers in green energy grids. Modeled in collaboration with Energistyrelsen.<br><br>Selected for the AAU Innovator Hub incubation program.",
-            "desc_da": "Udviklede model til vurdering af fleksible datacentres bidrag til profitabilitet af grøn energi. Modelleret i samarbejde med Energistyrelsen.<br><br>Optaget i AAU Innovator Hub (inkubationsprogram)."
-        },
-        {
-            "role_en": "Head of Technical Support", "role_da": "Head of Technical Support",
-            "company": "Introtech Ventures", "period": "Sep 2024 – Feb 2025",
-            "logo": "Introtech logo.png",
-            "desc_en": "Responsible for providing guidance and support to the operating teams, as well as overseeing key initiatives and ensuring task follow-up.<br><br>Provideded strategic guidance and advice on growth plans to drive business expansion, assess the competitive landscape, and advise senior management on key initiatives.",
-            "desc_da": "Ansvarlig for at yde vejledning og support til driftsteamet samt for at overvåge centrale initiativer og sikre opfølgning på opgaver.<br><br>Ydede strategisk rådgivning og vejledning om vækstplaner med henblik på at drive forretnings udvikling, vurdere konkurrencesituationen og rådgive den øverste ledelse om centrale initiativer."
-        },
-        {
-            "role_en": "Fundraiser", "role_da": "Fundraiser",
-            "company": "UNICEF", "period": "Nov 2023 – Jan 2024",
-            "logo": "Unicef logo.png",
-            "desc_en": "Direct engagement and fundraising for humanitarian aid initiatives.",
-            "desc_da": "Direkte engagement og fundraising til humanitære hjælpeinitiativer."
-        },
-        {
-            "role_en": "Substitute Teacher", "role_da": "Lærervikar",
-            "company": "Artium", "period": "Jan 2022 – Jun 2022",
-            "logo": "Artium logo.PNG",
-            "desc_en": "Classroom management and educational support.",
-            "desc_da": "Undervisning og faglig støtte."
-        },
-        {
-            "role_en": "Social Care Assistant", "role_da": "Pædagogmedhjælper",
-            "company": "Brande Åbo", "period": "Jan 2021 – Aug 2021",
-            "logo": "Brande åbo logo.png",
-            "desc_en": "Pedagogical support and care for residents with physical and mental disabilities.",
-            "desc_da": "Pædagogisk støtte og omsorg for beboere med fysiske og psykiske funktionsnedsættelser."
-        }
-    ]
+    # --- ASSET VALIDATION ---
+    trace.begin("asset validation")
+    # One normalized listing per folder; every reference is checked before anything is written
+    asset_index = {"images": build_asset_index(source_images_path), "pdfs": build_asset_index(source_pdfs_path)}
+    asset_placeholders = {"images": missing_image_placeholder, "pdfs": missing_pdf_placeholder}
+    missing_assets, unresolved_assets = [], []
 
-    # --- COMPETENCIES ---
-    competencies_list = [
-        {"en": "Ethnographic methods", "da": "Etnografiske metoder"},
-        {"en": "Qualitative & quantitative methods", "da": "Kvalitative & kvantitative metoder"},
-        {"en": "User involvement", "da": "Brugerinddragelse"},
-        {"en": "Interviewing", "da": "Interviewteknik"},
-        {"en": "AI alignment", "da": "AI alignment"},
-        {"en": "UI/UX research", "da": "UI/UX research"},
-        {"en": "Human-centered design", "da": "Brugercentreret design"},
-        {"en": "Participatory technology assessment & design", "da": "Participatorisk teknologivurdering & design"},
-        {"en": "Data scraping", "da": "Data scraping"},
-        {"en": "Network analysis", "da": "Netværksanalyse"},
-        {"en": "Data visualization", "da": "Datavisualisering"},
-        {"en": "Gephi", "da": "Gephi"},
-        {"en": "Philosophy of technology", "da": "Teknologifilosofi"},
-        {"en": "Life-cycle assessment (LCA)", "da": "Livscyklusvurdering (LCA)"},
-        {"en": "Problem-based learning (PBL)", "da": "Problembaseret læring (PBL)"},
-        {"en": "Adobe Photoshop / Premiere Pro", "da": "Adobe Photoshop / Premiere Pro"}
-    ]
+    # Byte-identical files are published once, references to copies point at the canonical name
+    asset_aliases = {}
+    duplicate_bytes = 0
+    for subdir, src_dir in [("images", source_images_path), ("pdfs", source_pdfs_path)]:
+        asset_aliases[subdir], groups = find_duplicate_assets(src_dir, asset_index[subdir])
+        for canonical, *copies in groups:
+            size = os.path.getsize(os.path.join(src_dir, canonical))
+            duplicate_bytes += size * len(copies)
+            for copy in copies:
+                print(f"Dedup: {subdir}/{copy} is identical to {subdir}/{canonical} ({size / 1024:.1f} KB)")
+    if duplicate_bytes:
+        print(f"Dedup: {duplicate_bytes / 1024:.1f} KB saved by publishing each unique file once")
 
-    # --- HTML HEAD ---
-    def get_head(page_title):
-        return f"""
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Portfolio | {user_name}</title>
-            <script src="https://cdn.tailwindcss.com"></script>
-            <link rel="preconnect" href="https://fonts.googleapis.com">
-            <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-            <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;800&family=Space+Grotesk:wght@400;500;700&display=swap" rel="stylesheet">
-            <script>
-                tailwind.config = {{
-                    theme: {{
-                        extend: {{
-                            fontFamily: {{
-                                sans: ['Inter', 'sans-serif'],
-                                mono: ['Space Grotesk', 'monospace'],
-                            }},
-                            colors: {{
-                                stone: {{ 50: '#fafaf9', 100: '#f5f5f4', 200: '#e7e5e4', 800: '#292524', 900: '#1c1917' }},
-                                teal: {{ 600: '#0d9488', 700: '#0f766e', 800: '#115e59', 900: '#134e4a' }}
-                            }},
-                            animation: {{
-                                'fade-up': 'fadeUp 0.8s ease-out forwards',
-                            }},
-                            keyframes: {{
-                                fadeUp: {{
-                                    '0%': {{ opacity: '0', transform: 'translateY(15px)' }},
-                                    '100%': {{ opacity: '1', transform: 'translateY(0)' }},
-                                }},
-                                popOut: {{
-                                    '0%': {{ transform: 'scale(1)' }},
-                                    '40%': {{ transform: 'scale(1.15)' }},
-                                    '100%': {{ transform: 'scale(0)', opacity: '0' }},
-                                }}
-                            }}
-                        }}
-                    }}
-                }}
-            </script>
-            <style>
-                html {{ scroll-behavior: smooth; overflow-x: hidden; }}
-                body {{ overflow-x: hidden; width: 100%; }}
-                .reveal {{ opacity: 0; transform: translateY(30px); transition: all 0.8s cubic-bezier(0.5, 0, 0, 1); }}
-                .reveal.active {{ opacity: 1; transform: translateY(0); }}
-                .project-card:hover {{ transform: translateY(-5px); box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.05); }}
-                .skill-card {{ transition: all 0.3s ease; }}
-                .skill-card:hover {{ border-color: #0d9488; transform: translateY(-3px); }}
-                .hidden {{ display: none; }}
-                #mobile-menu {{ transition: max-height 0.3s ease-in-out; max-height: 0; overflow: hidden; }}
-                #mobile-menu.open {{ max-height: 100vh; }}
-                .pop-out {{ animation: popOut 0.4s ease-in forwards !important; pointer-events: none; }}
-                .exp-logo {{ transition: transform 0.3s ease; }}
-                .exp-logo:hover {{ transform: scale(1.05); }}
-                .modern-input {{ width: 100%; background-color: #fafaf9; border: none; border-radius: 8px; padding: 16px; font-size: 0.95rem; color: #1c1917; box-shadow: inset 0 1px 2px rgba(0,0,0,0.06); transition: all 0.2s ease; }}
-                .modern-input:focus {{ background-color: #ffffff; box-shadow: 0 0 0 2px #0d9488, 0 4px 6px -1px rgba(0, 0, 0, 0.1); outline: none; }}
-                .modern-label {{ display: block; font-family: 'Space Grotesk', monospace; font-size: 0.75rem; text-transform: uppercase; letter-spacing: 0.05em; color: #57534e; margin-bottom: 0.5rem; font-weight: 700; }}
-                
-                /* Dynamic runaway button styles based on language session */
-                #runaway-da {{ position: absolute; left: {hire_da_pos}; top: 0; transition: transform 0.4s cubic-bezier(0.25, 1, 0.5, 1); }}
-                #runaway-en {{ position: absolute; left: {hire_en_pos}; top: 0; transition: transform 0.4s cubic-bezier(0.25, 1, 0.5, 1); }}
-
-                /* Strictly hide the runaway hire buttons on mobile only */
-                @media (max-width: 768px) {{
-                    #runaway-da, #runaway-en {{ display: none !important; }}
-                }}
-            </style>
-        </head>
-        """
-
-    # --- NAVIGATION ---
-    def get_nav(active_page):
-        links = {
-            "index.html": ("Index", "Forside"),
-            "casestudies.html": ("Case Studies", "Case studier"),
-            "experience.html": ("Work Experience", "Arbejdserfaring"),
-            "profile.html": ("Profile", "Profil"),
-            "contact.html": ("Contact", "Kontakt")
-        }
-        
-        nav_items_html = ""
-        for link, (en, da) in links.items():
-            active_class = "text-stone-900 border-b-2 border-teal-600 font-semibold" if link == active_page else "text-stone-500 hover:text-teal-600"
-            nav_items_html += f"""
-            <a href="{link}" class="font-mono text-sm uppercase tracking-widest py-1 transition-all duration-300 {active_class}">
-                <span class="lang-en">{en}</span><span class="lang-da hidden">{da}</span>
-            </a>
-            """
-
-        mobile_nav_html = ""
-        for link, (en, da) in links.items():
-            mobile_nav_html += f"""
-            <a href="{link}" class="block py-3 border-b border-stone-100 font-mono text-sm uppercase tracking-widest text-stone-600 hover:text-teal-600">
-                <span class="lang-en">{en}</span><span class="lang-da hidden">{da}</span>
-            </a>
-            """
-        
-        return f"""
-        <nav class="fixed top-0 w-full z-50 bg-white/95 backdrop-blur-md border-b border-stone-200">
-            <div class="max-w-6xl mx-auto px-6 h-20 flex justify-between items-center">
-                <a href="index.html" class="font-mono font-bold text-lg tracking-tighter group text-stone-900">
-                    T_Julsgaard<span class="text-teal-600">.exe</span>
-                </a>
-                
-                <div class="hidden md:flex items-center gap-8">
-                    <div class="flex gap-8">
-                        {nav_items_html}
-                    </div>
-                    <div class="flex items-center gap-2 font-mono text-xs border border-stone-200 rounded-full px-1 py-1">
-                        <button onclick="setLang('da')" id="btn-da" class="px-3 py-1 rounded-full transition-colors bg-stone-900 text-white">DA</button>
-                        <button onclick="setLang('en')" id="btn-en" class="px-3 py-1 rounded-full transition-colors text-stone-500 hover:text-stone-900">EN</button>
-                    </div>
-                </div>
-
-                <div class="md:hidden flex items-center gap-4">
-                    <div class="flex items-center gap-1 font-mono text-[10px] border border-stone-200 rounded-full px-1 py-1">
-                        <button onclick="setLang('da')" id="btn-da-mob" class="px-2 py-1 rounded-full transition-colors bg-stone-900 text-white">DA</button>
-                        <button onclick="setLang('en')" id="btn-en-mob" class="px-2 py-1 rounded-full transition-colors text-stone-500 hover:text-stone-900">EN</button>
-                    </div>
-                    <button id="mobile-menu-btn" class="text-stone-900 focus:outline-none">
-                        <svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6h16M4 12h16M4 18h16"></path></svg>
-                    </button>
-                </div>
-            </div>
-
-            <div id="mobile-menu" class="md:hidden bg-white border-b border-stone-200 px-6">
-                {mobile_nav_html}
-            </div>
-        </nav>
-        """
-
-    def get_footer():
-        return f"""
-        <footer class="bg-stone-900 text-stone-400 py-16 mt-20 relative z-10">
-            <div class="max-w-6xl mx-auto px-6 flex flex-col md:flex-row justify-between items-start gap-8">
-                <div class="mb-4 md:mb-0">
-                    <h3 class="font-mono text-stone-100 text-lg mb-2">{user_name}</h3>
-                    <p class="font-light text-sm max-w-xs">
-                        <span class="lang-en">Techno-Anthropologist.</span>
-                        <span class="lang-da hidden">Teknoantropolog.</span>
-                    </p>
-                </div>
-                <div class="flex flex-wrap gap-6 font-mono text-sm">
-                    <a href="contact.html" class="hover:text-teal-400 transition"><span class="lang-en">Contact</span><span class="lang-da hidden">Kontakt</span></a>
-                </div>
-            </div>
-        </footer>
-        <script>
-            function setLang(lang) {{
-                sessionStorage.setItem('preferredLang', lang);
-                const enElements = document.querySelectorAll('.lang-en');
-                const daElements = document.querySelectorAll('.lang-da');
-                
-                const btnsEn = [document.getElementById('btn-en'), document.getElementById('btn-en-mob')];
-                const btnsDa = [document.getElementById('btn-da'), document.getElementById('btn-da-mob')];
-
-                if (lang === 'da') {{
-                    enElements.forEach(el => el.classList.add('hidden'));
-                    daElements.forEach(el => el.classList.remove('hidden'));
-                    
-                    btnsDa.forEach(b => {{ if(b) b.className = "px-3 py-1 rounded-full transition-colors bg-stone-900 text-white"; }});
-                    btnsEn.forEach(b => {{ if(b) b.className = "px-3 py-1 rounded-full transition-colors text-stone-500 hover:text-stone-900"; }});
-                    if(document.getElementById('btn-en-mob')) document.getElementById('btn-en-mob').classList.replace('px-3', 'px-2');
-                    if(document.getElementById('btn-da-mob')) document.getElementById('btn-da-mob').classList.replace('px-3', 'px-2');
-                }} else {{
-                    daElements.forEach(el => el.classList.add('hidden'));
-                    enElements.forEach(el => el.classList.remove('hidden'));
-                    
-                    btnsEn.forEach(b => {{ if(b) b.className = "px-3 py-1 rounded-full transition-colors bg-stone-900 text-white"; }});
-                    btnsDa.forEach(b => {{ if(b) b.className = "px-3 py-1 rounded-full transition-colors text-stone-500 hover:text-stone-900"; }});
-                    if(document.getElementById('btn-en-mob')) document.getElementById('btn-en-mob').classList.replace('px-3', 'px-2');
-                    if(document.getElementById('btn-da-mob')) document.getElementById('btn-da-mob').classList.replace('px-3', 'px-2');
-                }}
-            }}
-
-            document.addEventListener('DOMContentLoaded', () => {{
-                window.scrollTo(0, 0);
-                const savedLang = sessionStorage.getItem('preferredLang') || 'da';
-                setLang(savedLang);
-                
-                const observer = new IntersectionObserver((entries) => {{
-                    entries.forEach(entry => {{
-                        if (entry.isIntersecting) entry.target.classList.add('active');
-                    }});
-                }}, {{ threshold: 0.1 }});
-                document.querySelectorAll('.reveal').forEach(el => observer.observe(el));
-
-                const menuBtn = document.getElementById('mobile-menu-btn');
-                const mobileMenu = document.getElementById('mobile-menu');
-                if(menuBtn && mobileMenu) {{
-                    menuBtn.addEventListener('click', () => {{
-                        mobileMenu.classList.toggle('open');
-                    }});
-                }}
-            }});
-        </script>
-        """
-
-    # --- 1. INDEX PAGE ---
-    featured_indices = [0, 4, 2]
-    featured_html = ""
-    for idx in featured_indices:
-        p = projects[idx]
-        order_class = "md:order-1" if featured_indices.index(idx) % 2 == 0 else "md:order-2"
-        text_order = "md:order-2" if featured_indices.index(idx) % 2 == 0 else "md:order-1"
-        
-        featured_html += f"""
-        <div class="group grid md:grid-cols-12 gap-8 md:gap-16 items-center reveal mb-32 last:mb-0">
-            <div class="md:col-span-6 {order_class} relative">
-                <a href="casestudies.html#{p['id']}" class="block overflow-hidden rounded shadow-lg hover:shadow-2xl transition-all duration-500">
-                    <div class="relative aspect-[3/4] bg-stone-200">
-                        <img src="images/{p['img']}" alt="{p['title']}" class="absolute inset-0 w-full h-full object-cover transition-transform duration-700 group-hover:scale-105">
-                    </div>
-                </a>
-            </div>
-            <div class="md:col-span-6 {text_order}">
-                <div class="flex flex-wrap gap-2 mb-4">
-                    {' '.join([f'<span class="font-mono text-teal-600 text-xs uppercase tracking-widest border border-teal-600/20 px-2 py-1 rounded">{t}</span>' for t in p['tags']])}
-                </div>
-                <h3 class="text-3xl md:text-4xl font-bold mb-4 leading-tight text-stone-900">{p['title']}</h3>
-                <p class="font-mono text-sm text-stone-400 mb-6 uppercase tracking-wide">{p['subtitle']}</p>
-                <p class="text-stone-600 mb-8 leading-relaxed text-lg font-light">{p['summary']}</p>
-                <a href="casestudies.html#{p['id']}" class="inline-flex items-center gap-2 border-b border-stone-900 pb-1 font-mono hover:text-teal-600 hover:border-teal-600 transition">
-                    <span class="lang-en">Read Report</span><span class="lang-da hidden">Læs Rapport</span> <span class="text-lg">&rarr;</span>
-                </a>
-            </div>
-        </div>
-        """
-
-    index_page = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    {get_head("Home")}
-    <body class="bg-stone-50 text-stone-900 pt-20">
-        {get_nav("index.html")}
-        <main class="max-w-6xl mx-auto px-6">
-            <section class="grid md:grid-cols-2 gap-12 items-start pt-10 md:pt-16 pb-4">
-                <div class="order-2 md:order-1 relative z-10 animate-fade-up">
-                    <p class="font-mono text-teal-700 mb-4 tracking-widest text-sm uppercase font-bold">
-                        <span class="lang-en">Techno-Anthropologist</span><span class="lang-da hidden">Teknoantropolog</span>
-                    </p>
-                    <h1 class="text-4xl md:text-5xl lg:text-6xl font-bold leading-tight tracking-tighter mb-4 max-w-2xl text-stone-900">
-                        <span class="lang-en">Bridging the gap<br>between data<br>and <span class="text-transparent bg-clip-text bg-gradient-to-r from-stone-900 to-teal-900">human insight.</span></span>
-                        <span class="lang-da hidden">Brobygger<br>mellem data og<br><span class="whitespace-nowrap text-transparent bg-clip-text bg-gradient-to-r from-stone-900 to-teal-900">menneskelig indsigt.</span></span>
-                    </h1>
-                    <p class="text-lg md:text-xl text-stone-600 max-w-2xl font-light leading-relaxed border-l-2 border-teal-600 pl-6 mt-6">
-                        <span class="lang-en">My strength lies in speaking both 'developer' and 'user'. I translate complex technical systems into concrete design and organizational strategies.</span>
-                        <span class="lang-da hidden">Min styrke ligger i at tale både 'udvikler' og 'bruger'. Jeg oversætter komplekse tekniske systemer til konkrete designs og organisatoriske strategier.</span>
-                    </p>
-                    <div id="prank-container" class="relative mt-6 w-full max-w-4xl h-[400px] border border-transparent">
-                        <a href="pdfs/{cv_file}" target="_blank" class="lang-da hidden absolute {cv_da_pos} top-0 bg-stone-900 text-white px-8 py-4 rounded-full font-mono text-xs uppercase tracking-widest shadow-lg hover:bg-teal-600 transition-all cursor-pointer whitespace-nowrap">
-                            Hent CV
-                        </a>
-                        <button id="runaway-da" class="lang-da hidden bg-stone-900 text-white px-8 py-4 rounded-full font-mono text-xs uppercase tracking-widest shadow-lg cursor-pointer whitespace-nowrap hover:bg-teal-600">
-                            Ansæt som ulønnet praktikant
-                        </button>
-
-                        <a href="pdfs/{cv_file}" target="_blank" class="lang-en absolute {cv_en_pos} top-0 bg-stone-900 text-white px-8 py-4 rounded-full font-mono text-xs uppercase tracking-widest shadow-lg hover:bg-teal-600 transition-all cursor-pointer whitespace-nowrap">
-                            Download CV
-                        </a>
-                        <button id="runaway-en" class="lang-en bg-stone-900 text-white px-8 py-4 rounded-full font-mono text-xs uppercase tracking-widest shadow-lg cursor-pointer whitespace-nowrap hover:bg-teal-600">
-                            Hire as unpaid intern
-                        </button>
-                    </div>
-                </div>
-                <div class="order-1 md:order-2 flex flex-col justify-center items-center md:items-end animate-fade-up" style="animation-delay: 0.2s;">
-                    <h2 class="text-xl font-extrabold text-stone-900 mb-2 tracking-tight self-start md:self-end cursor-default">{user_name}</h2>
-                    <div class="group relative w-full max-w-md aspect-square">
-                        <div class="absolute inset-0 border-2 border-stone-800 translate-x-4 translate-y-4 transition-transform duration-500 group-hover:translate-x-2 group-hover:translate-y-2"></div>
-                        <div class="relative w-full h-full overflow-hidden bg-stone-200 shadow-xl">
-                            <img src="images/{profile_image_index}" class="w-full h-full object-cover transition-all duration-700 filter grayscale group-hover:grayscale-0 group-hover:scale-105" alt="Thomas Julsgaard">
-                        </div>
-                    </div>
-                </div>
-            </section>
-            <section class="pt-4 md:pt-20 pb-10">
-                <div class="flex justify-between items-end mb-12 md:mb-16 reveal border-b border-stone-200 pb-8">
-                    <h2 class="text-3xl md:text-4xl font-bold text-stone-900">
-                        <span class="lang-en">Selected Work</span><span class="lang-da hidden">Udvalgte Projekter</span>
-                    </h2>
-                </div>
-                {featured_html}
-                <div class="text-center mt-24 reveal">
-                    <a href="casestudies.html" class="inline-block px-10 py-4 bg-stone-900 text-stone-50 rounded-full font-mono text-sm hover:bg-teal-600 transition duration-300">
-                        <span class="lang-en">View All Case Studies</span><span class="lang-da hidden">Se Alle Case Studier</span>
-                    </a>
-                </div>
-            </section>
-        </main>
-        {get_footer()}
-        <script>
-            document.addEventListener('DOMContentLoaded', () => {{
-                const container = document.getElementById('prank-container');
-                let isCooldown = false;
-
-                // State tracking for both buttons
-                let daState = {{ x: 0, y: 0 }};
-                let enState = {{ x: 0, y: 0 }};
-
-                if(container) {{
-                    const triggerMove = (mouseX, mouseY, btn, state) => {{
-                        if (isCooldown) return;
-                        const btnRect = btn.getBoundingClientRect();
-                        const containerRect = container.getBoundingClientRect();
-                        const btnCenterX = btnRect.left + btnRect.width / 2;
-                        const btnCenterY = btnRect.top + btnRect.height / 2;
-                        let dirX = btnCenterX - mouseX;
-                        let dirY = btnCenterY - mouseY;
-                        if (dirX === 0 && dirY === 0) {{ dirX = 1; dirY = 1; }}
-                        const length = Math.sqrt(dirX * dirX + dirY * dirY);
-                        const normX = dirX / length;
-                        const normY = dirY / length;
-                        const jumpDistance = 300; 
-                        
-                        state.x += normX * jumpDistance;
-                        state.y += normY * jumpDistance;
-                        
-                        if (Math.abs(state.x) > containerRect.width/2 - 50) state.x *= -0.5;
-                        if (Math.abs(state.y) > containerRect.height - 50) state.y *= -0.5;
-                        
-                        btn.style.transform = `translate(${{state.x}}px, ${{state.y}}px)`;
-                        isCooldown = true;
-                        setTimeout(() => {{ isCooldown = false; }}, 400); 
-                    }};
-
-                    container.addEventListener('mousemove', (e) => {{
-                        const lang = sessionStorage.getItem('preferredLang') || 'da';
-                        const btn = lang === 'da' ? document.getElementById('runaway-da') : document.getElementById('runaway-en');
-                        const state = lang === 'da' ? daState : enState;
-                        
-                        if(!btn) return;
-                        const btnRect = btn.getBoundingClientRect();
-                        const buffer = 1; 
-                        if (e.clientX > btnRect.left - buffer && e.clientX < btnRect.right + buffer &&
-                            e.clientY > btnRect.top - buffer && e.clientY < btnRect.bottom + buffer) {{
-                            triggerMove(e.clientX, e.clientY, btn, state);
-                        }}
-                    }});
-
-                    const setupRunAway = (btn, state) => {{
-                        const runAwayAction = (e) => {{
-                            e.preventDefault();
-                            let clientX = e.clientX || (e.touches && e.touches[0].clientX);
-                            let clientY = e.clientY || (e.touches && e.touches[0].clientY);
-                            triggerMove(clientX, clientY, btn, state);
-                        }};
-                        btn.addEventListener('click', runAwayAction);
-                        btn.addEventListener('touchstart', runAwayAction);
-                    }};
-
-                    const btnDa = document.getElementById('runaway-da');
-                    const btnEn = document.getElementById('runaway-en');
-                    if(btnDa) setupRunAway(btnDa, daState);
-                    if(btnEn) setupRunAway(btnEn, enState);
-                }}
-            }});
-        </script>
-    </body>
-    </html>
-    """
+    def check_asset(subdir, filename, owner):
+        found, hint = find_asset(asset_index[subdir], filename)
+        if found is not None:
+            return asset_aliases[subdir].get(found, found)
+        message = f"{subdir}/{filename} ({owner})" + (f" - did you mean '{hint}'?" if hint else "")
+        missing_assets.append(message)
+        placeholder = asset_placeholders[subdir]
+        if placeholder is None or find_asset(asset_index[subdir], placeholder)[0] is None:
+            unresolved_assets.append(message)
+            return filename
+        return find_asset(asset_index[subdir], placeholder)[0]
 
-    # --- 2. CASE STUDIES PAGE ---
-    projects_list_html = ""
     for p in projects:
-        projects_list_html += f"""
-        <article id="{p['id']}" class="bg-white rounded-xl shadow-sm border border-stone-100 reveal overflow-hidden mb-16 scroll-mt-32 project-card transition-all duration-300">
-            <div class="grid md:grid-cols-12">
-                <div class="md:col-span-4 bg-stone-100 relative h-64 md:h-auto md:min-h-full group cursor-pointer" onclick="window.open('pdfs/{p['pdf']}', '_blank')">
-                    <img src="images/{p['img']}" alt="{p['title']}" class="absolute inset-0 w-full h-full object-cover transition-opacity duration-300 group-hover:opacity-90">
-                    <div class="absolute inset-0 flex items-center justify-center opacity-100 md:opacity-0 md:group-hover:opacity-100 transition-opacity duration-300 bg-stone-900/40">
-                         <span class="bg-white text-stone-900 px-4 py-2 rounded font-mono text-xs uppercase tracking-widest">
-                            <span class="lang-en">Read PDF</span><span class="lang-da hidden">Læs PDF</span>
-                         </span>
-                    </div>
-                </div>
-                <div class="md:col-span-8 p-8 md:p-12 flex flex-col justify-center">
-                    <div class="flex justify-between items-start mb-6">
-                        <div class="flex flex-wrap gap-2">
-                            {' '.join([f'<span class="text-xs font-mono uppercase tracking-wider text-teal-600 bg-teal-50 px-2 py-1 rounded">{tag}</span>' for tag in p['tags']])}
-                        </div>
-                        <a href="pdfs/{p['pdf']}" target="_blank" class="text-stone-400 hover:text-teal-600 transition">
-                            <svg xmlns="http://www.w3.org/2000/svg" class="h-6 w-6" fill="none" viewBox="0 0 24 24" stroke="currentColor">
-                              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" />
-                            </svg>
-                        </a>
-                    </div>
-                    <h2 class="text-3xl md:text-4xl font-bold mb-2 text-stone-900">{p['title']}</h2>
-                    <p class="text-lg text-stone-500 mb-8 font-light italic">{p['subtitle']}</p>
-                    <p class="text-stone-800 mb-8 leading-relaxed font-medium">{p['summary']}</p>
-                    <div class="grid md:grid-cols-3 gap-8 pt-8 border-t border-stone-100">
-                        <div>
-                             <h4 class="font-mono text-xs font-bold text-stone-900 mb-2 uppercase tracking-wider">
-                                <span class="lang-en">Context</span><span class="lang-da hidden">Kontekst</span>
-                             </h4>
-                             <p class="text-stone-600 text-sm leading-relaxed">{p['context']}</p>
-                        </div>
-                        <div>
-                            <h4 class="font-mono text-xs font-bold text-stone-900 mb-2 uppercase tracking-wider">
-                                <span class="lang-en">Methods</span><span class="lang-da hidden">Metoder</span>
-                            </h4>
-                            <p class="text-stone-600 text-sm leading-relaxed">{p['methods']}</p>
-                        </div>
-                        <div>
-                            <h4 class="font-mono text-xs font-bold text-stone-900 mb-2 uppercase tracking-wider">
-                                <span class="lang-en">Outcomes</span><span class="lang-da hidden">Resultater</span>
-                            </h4>
-                            <p class="text-stone-600 text-sm leading-relaxed">{p['outcomes']}</p>
-                        </div>
-                    </div>
-                    <div class="mt-8 pt-4">
-                        <a href="pdfs/{p['pdf']}" target="_blank" class="inline-block bg-stone-900 text-white px-6 py-3 rounded-md font-mono text-xs uppercase tracking-widest hover:bg-teal-600 transition">
-                            <span class="lang-en">Download Report</span><span class="lang-da hidden">Download Rapport</span>
-                        </a>
-                    </div>
-                </div>
-            </div>
-        </article>
-        """
-
-    casestudies_page = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    {get_head("Case Studies")}
-    <body class="bg-stone-50 text-stone-900 pt-20">
-        {get_nav("casestudies.html")}
-        <main class="max-w-6xl mx-auto px-6 py-20">
-            <header class="mb-12 reveal">
-                <h1 class="text-4xl md:text-6xl font-bold mb-6 tracking-tight text-stone-900">
-                    <span class="lang-en">Case Studies</span><span class="lang-da hidden">Case Studier</span>
-                </h1>
-                <p class="text-xl text-stone-600 font-light max-w-none leading-relaxed">
-                    <span class="lang-en">A collection of research into socio-technical networks, participatory design, and digital ethnography.</span>
-                    <span class="lang-da hidden">En samling af min forskning i det, der sker, når teknologier møder virkeligheden.</span>
-                </p>
-            </header>
-            <div class="space-y-12">{projects_list_html}</div>
-        </main>
-        {get_footer()}
-    </body>
-    </html>
-    """
+        if p.get("img"):
+            p["img"] = check_asset("images", p["img"], f"project '{p['id']}'")
+        p["pdf"] = check_asset("pdfs", p["pdf"], f"project '{p['id']}'")
+    for exp in experiences:
+        exp["logo"] = check_asset("images", exp["logo"], f"experience '{exp['company']}'")
+    profile_image_index = check_asset("images", profile_image_index, "profile_image_index")
+    profile_image_profile = check_asset("images", profile_image_profile, "profile_image_profile")
+    cv_file = check_asset("pdfs", cv_file, "cv_file")
+    bsc_certificate_file = check_asset("pdfs", bsc_certificate_file, "bsc_certificate_file")
+    tutor_certificate_file = check_asset("pdfs", tutor_certificate_file, "tutor_certificate_file")
+
+    if unresolved_assets and not allow_missing:
+        report = "\n".join(f"  - {m}" for m in unresolved_assets)
+        raise SystemExit(f"ERROR: {len(unresolved_assets)} referenced asset(s) not found, nothing was written:\n{report}")
+    if missing_assets:
+        print(f"WARNING: {len(missing_assets)} referenced asset(s) not found:")
+        for message in missing_assets:
+            print(f"  - {message}")
+    # Nothing is written, not even to the cache, until content and assets have validated
+    if content_cache is not None:
+        save_content_cache(cache_path, content_cache)
+
+    # --- PDF PIPELINE ---
+    trace.begin("pdfs")
+    # Linearized, recompressed copies are published in place of the originals
+    published_pdfs = [p["pdf"] for p in projects] + [cv_file, bsc_certificate_file, tutor_certificate_file]
+    optimized_pdfs = {}
+    if pikepdf is None:
+        print("NOTE: pikepdf not installed, PDFs are published as-is.")
+    else:
+        pdf_cache_path = os.path.join(cache_path, PDF_CACHE_DIR)
+        for filename in dict.fromkeys(published_pdfs):
+            if os.path.isfile(os.path.join(source_pdfs_path, filename)):
+                optimized_pdfs[filename] = optimize_pdf(os.path.join(source_pdfs_path, filename), pdf_cache_path)
+        remove_unused_cache_files(pdf_cache_path, optimized_pdfs.values())
+        before = sum(os.path.getsize(os.path.join(source_pdfs_path, f)) for f in optimized_pdfs)
+        after = sum(os.path.getsize(path) for path in optimized_pdfs.values())
+        print(f"PDFs: {len(optimized_pdfs)} linearized, {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
 
-    # --- 3. EXPERIENCE PAGE ---
-    experience_list_html = ""
+    # Projects without a card image show the first page of their report
+    thumbnails = []
+    for p in projects:
+        pdf_file = os.path.join(source_pdfs_path, p["pdf"])
+        if not p.get("img") and pymupdf is not None and os.path.isfile(pdf_file):
+            thumbnails.append(pdf_thumbnail(pdf_file, os.path.join(cache_path, PDF_THUMBNAIL_DIR)))
+            p["img"] = thumbnails[-1]
+        elif not p.get("img"):
+            print(f"NOTE: project '{p['id']}' has no img and no PDF thumbnail (PyMuPDF not installed or PDF missing).")
+            p["img"] = ""
+    remove_unused_cache_files(os.path.join(cache_path, PDF_THUMBNAIL_DIR), thumbnails)
+
+    # --- IMAGE VARIANTS ---
+    trace.begin("images")
+    image_requests = {}
+    image_uses = set()
+    def request_image(filename, slot):
+        if filename:
+            image_requests.setdefault(filename, set()).update(image_slots[slot][0])
+            image_uses.add((filename, slot))
+
+    for p in featured_projects:
+        request_image(p["img"], "featured")
+    for p in projects:
+        request_image(p["img"], "card")
+        request_image(p["img"], "thumb")
     for exp in experiences:
-        experience_list_html += f"""
-        <div class="relative pl-8 md:pl-0 mb-16 reveal">
-            <div class="hidden md:block absolute left-[50%] top-0 bottom-0 w-px bg-stone-300 transform -translate-x-1/2"></div>
-            <div class="grid md:grid-cols-2 gap-8 md:gap-16 relative">
-                <div class="hidden md:block absolute left-[50%] top-2 w-3 h-3 bg-stone-900 rounded-full transform -translate-x-1/2 border-4 border-stone-50"></div>
-                <div class="md:text-right md:pr-8 flex flex-col md:items-end items-center">
-                    <span class="inline-block px-3 py-1 bg-stone-200 text-stone-600 rounded-full text-xs font-mono font-bold mb-4">{exp['period']}</span>
-                    <div class="flex justify-center w-full md:justify-end">
-                        <img src="images/{exp['logo']}" class="exp-logo h-12 w-auto max-w-[120px] object-contain">
-                    </div>
-                </div>
-                <div class="md:pl-8">
-                    <h3 class="text-2xl font-bold text-stone-900">
-                        <span class="lang-en">{exp['role_en']}</span><span class="lang-da hidden">{exp['role_da']}</span>
-                    </h3>
-                    <p class="text-teal-700 font-medium mb-3">{exp['company']}</p>
-                    <p class="text-stone-600 leading-relaxed max-w-lg">
-                        <span class="lang-en">{exp['desc_en']}</span><span class="lang-da hidden">{exp['desc_da']}</span>
-                    </p>
-                </div>
-            </div>
-        </div>
-        """
-
-    experience_page = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    {get_head("Experience")}
-    <body class="bg-stone-50 text-stone-900 pt-20">
-        {get_nav("experience.html")}
-        <main class="max-w-5xl mx-auto px-6 py-20">
-            <header class="mb-20 reveal text-center">
-                <h1 class="text-4xl md:text-6xl font-bold mb-6 text-stone-900">
-                    <span class="lang-en">Work Experience</span><span class="lang-da hidden">Arbejdserfaring</span>
-                </h1>
-            </header>
-            <div class="relative py-10 max-w-4xl mx-auto">{experience_list_html}</div>
-        </main>
-        {get_footer()}
-    </body>
-    </html>
-    """
-
-    # --- 4. PROFILE PAGE ---
-    skills_grid = ""
-    for skill in competencies_list:
-        skills_grid += f"""
-        <div class="skill-card p-4 border border-stone-200 rounded-lg bg-white hover:shadow-md flex items-center justify-center text-center">
-            <h4 class="font-medium text-stone-800 text-sm">
-                <span class="lang-en">{skill['en']}</span>
-                <span class="lang-da hidden">{skill['da']}</span>
-            </h4>
-        </div>
-        """
-
-    profile_page = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    {get_head("Profile")}
-    <body class="bg-stone-50 text-stone-900 pt-20">
-        {get_nav("profile.html")}
-        <main class="max-w-6xl mx-auto px-6 py-20">
-            <div class="flex flex-col md:flex-row gap-12 items-stretch mb-24 reveal">
-                <div class="md:w-5/12">
-                    <div class="relative w-full h-full overflow-hidden rounded-lg shadow-lg group min-h-[400px]">
-                         <img src="images/{profile_image_profile}" class="w-full h-full object-cover transition-transform duration-700 group-hover:scale-105">
-                         <div class="absolute inset-0 bg-stone-900/10 group-hover:bg-transparent transition-colors duration-500"></div>
-                    </div>
-                </div>
-                <div class="md:w-7/12 flex flex-col justify-between">
-                    <div class="p-8 bg-stone-100 rounded-xl border-l-4 border-teal-600 h-full flex flex-col justify-center">
-                        <h3 class="text-lg font-bold uppercase tracking-widest text-stone-500 mb-6">
-                            <span class="lang-en">Education</span><span class="lang-da hidden">Uddannelse</span>
-                        </h3>
-                        
-                        <div class="mb-8">
-                            <div class="flex justify-between items-baseline mb-2">
-                                <h4 class="text-xl font-bold text-stone-900">
-                                    <span class="lang-en">BSc, Techno-Anthropology</span>
-                                    <span class="lang-da hidden">BSc, Teknoantropologi</span>
-                                </h4>
-                                <span class="text-sm font-mono text-stone-500">2022 – 2025</span>
-                            </div>
-                            <p class="text-teal-700 font-medium mb-2">
-                                <span class="lang-en">Aalborg University, Copenhagen</span>
-                                <span class="lang-da hidden">Aalborg Universitet, København</span>
-                            </p>
-                            <p class="text-stone-600 text-sm mb-4">
-                                <span class="lang-en">Weighted avg: 11.3 (Danish 7-scale) / ~3.9 GPA equivalent.</span>
-                                <span class="lang-da hidden">Vægtet gennemsnit: 11,3 (7-trins-skala).</span>
-                            </p>
-                            <a href="pdfs/{bsc_certificate_file}" target="_blank" class="inline-flex items-center gap-2 text-xs font-bold uppercase tracking-widest text-stone-900 border-b border-stone-300 hover:text-teal-600 hover:border-teal-600 transition">
-                                <svg class="w-4 h-4" fill="none" viewBox="0 0 24 24" stroke="currentColor"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 10v6m0 0l-3-3m3 3l3-3m2 8H7a2 2 0 01-2-2V5a2 2 0 012-2h5.586a1 1 0 01.707.293l5.414 5.414a1 1 0 01.293.707V19a2 2 0 01-2 2z" /></svg>
-                                <span class="lang-en">Download Certificate</span><span class="lang-da hidden">Hent Bevis</span>
-                            </a>
-                        </div>
-
-                        <div class="mb-8">
-                            <div class="flex justify-between items-baseline mb-2">
-                                <h4 class="text-xl font-bold text-stone-900">
-                                    <span class="lang-en">Film Production</span>
-                                    <span class="lang-da hidden">Film Produktion</span>
-                                </h4>
-                                <span class="text-sm font-mono text-stone-500">2021</span>
-                            </div>
-                            <p class="text-teal-700 font-medium mb-2">
-                            <span class="lang-en">Askov Folk High School</span><span class="lang-da hidden">Askov Højskole</span></p>
-                            <p class="text-stone-600 text-sm">
-                                <span class="lang-en">Proficiency in the Adobe Suite (Premiere Pro, Photoshop).</span>
-                                <span class="lang-da hidden">Fortrolig med Adobe-pakken (Premiere Pro, Photoshop).</span>
-                            </p>
-                        </div>
-
-                         <div>
-                            <div class="flex justify-between items-baseline mb-2">
-                                <h4 class="text-xl font-bold text-stone-900">
-                                    <span class="lang-en">IBG / Democracy & Globalization</span>
-                                    <span class="lang-da hidden">IBG / Demokrati & Globalisering</span>
-                                </h4>
-                                <span class="text-sm font-mono text-stone-500">2017 – 2020</span>
-                            </div>
-                             <p class="text-teal-700 font-medium mb-2">Ikast-Brande Gymnasium</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <section class="reveal">
-                <div class="flex items-center gap-4 mb-8">
-                    <div class="h-px bg-stone-300 flex-grow"></div>
-                    <h2 class="font-mono text-sm font-bold uppercase tracking-widest text-stone-400">
-                        <span class="lang-en">Core Competencies</span><span class="lang-da hidden">Kernekompetencer</span>
-                    </h2>
-                    <div class="h-px bg-stone-300 flex-grow"></div>
-                </div>
-                <div class="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-4 gap-4">
-                    {skills_grid}
-                </div>
-            </section>
-            
-             <section class="reveal mt-20">
-                 <div class="flex items-center gap-4 mb-8">
-                    <div class="h-px bg-stone-300 flex-grow"></div>
-                    <h2 class="font-mono text-sm font-bold uppercase tracking-widest text-stone-400">
-                        <span class="lang-en">Volunteering</span><span class="lang-da hidden">Frivilligt Arbejde</span>
-                    </h2>
-                    <div class="h-px bg-stone-300 flex-grow"></div>
-                </div>
-                 <div class="grid md:grid-cols-2 gap-8">
-                    <div class="bg-white p-6 rounded-xl border border-stone-200 shadow-sm">
-                         <div class="flex justify-between items-start mb-2">
-                            <span class="font-bold text-stone-900">
-                                <span class="lang-en">Vice Chairman</span><span class="lang-da hidden">Næstformand</span>
-                            </span>
-                            <span class="text-xs font-mono text-stone-500">
-                                <span class="lang-en">Aug 2022 - Present</span><span class="lang-da hidden">Aug 2022 - Nu</span>
-                            </span>
-                         </div>
-                        <p class="text-stone-500 text-sm">
-                            <span class="lang-en">Askov Folk High School Student Association</span>
-                            <span class="lang-da hidden">Askov Højskoles elevforening</span>
-                        </p>
-                    </div>
-                    <div class="bg-white p-6 rounded-xl border border-stone-200 shadow-sm">
-                         <div class="flex justify-between items-start mb-2">
-                            <span class="font-bold text-stone-900">
-                                <span class="lang-en">Tutor</span><span class="lang-da hidden">Tutor</span>
-                            </span>
-                            <span class="text-xs font-mono text-stone-500">Sep 2023 - Dec 2023</span>
-                         </div>
-                        <p class="text-stone-500 text-sm mb-3">
-                            <span class="lang-en">Aalborg University</span>
-                            <span class="lang-da hidden">Aalborg Universitet</span>
-                        </p>
-                         <a href="pdfs/{tutor_certificate_file}" target="_blank" class="inline-flex items-center gap-1 text-xs font-bold uppercase text-teal-700 hover:text-teal-900">
-                            <span class="lang-en">Download Certificate</span><span class="lang-da hidden">Hent Bevis</span> &darr;
-                        </a>
-                    </div>
-                 </div>
-            </section>
-        </main>
-        {get_footer()}
-    </body>
-    </html>
-    """
+        request_image(exp["logo"], "logo")
+    request_image(profile_image_index, "profile_index")
+    request_image(profile_image_profile, "profile_page")
 
-    # --- 5. CONTACT PAGE ---
-    contact_page = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    {get_head("Contact")}
-    <body class="bg-stone-50 text-stone-900 pt-20 flex flex-col min-h-screen">
-        {get_nav("contact.html")}
-        <main class="flex-grow flex items-center justify-center px-6 py-10 md:py-20 overflow-hidden">
-            <div class="max-w-6xl w-full reveal">
-                <div class="grid md:grid-cols-2 gap-12 md:gap-16 items-start">
-                    <div>
-                        <p class="font-mono text-teal-600 mb-4 md:mb-6 tracking-widest uppercase">
-                            <span class="lang-en">Contact</span><span class="lang-da hidden">Kontakt</span>
-                        </p>
-                        <h1 class="text-4xl md:text-6xl font-bold mb-6 md:mb-8 tracking-tight text-stone-900">
-                            <span class="lang-en">Let's get in touch.</span><span class="lang-da hidden whitespace-nowrap">Lad os tage en snak.</span>
-                        </h1>
-                        <p class="text-lg md:text-xl text-stone-600 mb-8 md:mb-12 font-light leading-relaxed">
-                            <span class="lang-en">I am always open to discussing job opportunities, research collaborations, or new projects.</span>
-                            <span class="lang-da hidden">Jeg er altid åben for at diskutere nye jobmuligheder, forskningssamarbejder eller diverse projekter.</span>
-                        </p>
-                        <div class="flex flex-col gap-4">
-                            <a href="{linkedin_url}" target="_blank" class="flex items-center gap-4 group p-4 border border-stone-200 rounded-lg bg-white hover:border-teal-500 transition-all duration-300">
-                                <div class="w-10 h-10 flex flex-center items-center justify-center bg-stone-100 rounded-full group-hover:bg-teal-50">
-                                    <svg class="w-5 h-5 text-stone-600 group-hover:text-teal-700" fill="currentColor" viewBox="0 0 24 24"><path d="M19 0h-14c-2.761 0-5 2.239-5 5v14c0 2.761 2.239 5 5 5h14c2.762 0 5-2.239 5-5v-14c0-2.761-2.238-5-5-5zm-11 19h-3v-11h3v11zm-1.5-12.268c-.966 0-1.75-.79-1.75-1.764s.784-1.764 1.75-1.764 1.75.79 1.75 1.764-.783 1.764-1.75 1.764zm13.5 12.268h-3v-5.604c0-3.368-4-3.113-4 0v5.604h-3v-11h3v1.765c1.396-2.586 7-2.777 7 2.476v6.759z"/></svg>
-                                </div>
-                                <span class="font-mono text-xs md:text-sm uppercase tracking-wider text-stone-600 group-hover:text-stone-900 truncate">/thomasjulsgaard</span>
-                            </a>
-                            <a href="{github_url}" target="_blank" class="flex items-center gap-4 group p-4 border border-stone-200 rounded-lg bg-white hover:border-teal-500 transition-all duration-300">
-                                <div class="w-10 h-10 flex flex-center items-center justify-center bg-stone-100 rounded-full group-hover:bg-teal-50">
-                                    <svg class="w-5 h-5 text-stone-600 group-hover:text-teal-700" fill="currentColor" viewBox="0 0 24 24"><path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6086 8.199-11.386 0-6.627-5.373-12-12-12z"/></svg>
-                                </div>
-                                <span class="font-mono text-xs md:text-sm uppercase tracking-wider text-stone-600 group-hover:text-stone-900 truncate">/T-Julsgaard</span>
-                            </a>
-                        </div>
-                    </div>
-                    <div class="bg-white p-6 md:p-8 rounded-2xl shadow-sm border border-stone-100 w-full max-w-full">
-                        <form action="https://formspree.io/f/mbdlvnjo" method="POST" class="space-y-6">
-                            <div class="grid grid-cols-1 sm:grid-cols-2 gap-6">
-                                <div>
-                                    <label class="modern-label">
-                                        <span class="lang-en">Name</span><span class="lang-da hidden">Navn</span>
-                                    </label>
-                                    <input type="text" name="name" required class="modern-input">
-                                </div>
-                                <div>
-                                    <label class="modern-label">Email</label>
-                                    <input type="email" name="_replyto" required class="modern-input">
-                                </div>
-                            </div>
-                            <div>
-                                <label class="modern-label">
-                                    <span class="lang-en">Subject</span><span class="lang-da hidden">Emne</span>
-                                </label>
-                                <input type="text" name="subject" class="modern-input">
-                            </div>
-                            <div>
-                                <label class="modern-label">
-                                    <span class="lang-en">Message</span><span class="lang-da hidden">Besked</span>
-                                </label>
-                                <textarea name="message" required rows="5" class="modern-input"></textarea>
-                            </div>
-                            <button type="submit" class="w-full bg-stone-900 text-white py-4 rounded-lg font-mono text-xs uppercase tracking-widest hover:bg-teal-600 transition-colors duration-300 shadow-lg">
-                                <span class="lang-en">Send Message</span><span class="lang-da hidden">Send Besked</span>
-                            </button>
-                            <input type="text" name="_gotcha" style="display:none">
-                        </form>
-                    </div>
-                </div>
-            </div>
-        </main>
-        {get_footer()}
-    </body>
-    </html>
-    """
+    manifest = load_manifest(base_path) if incremental else {"images": {}, "outputs": {}}
+    previous_outputs = manifest["outputs"]
+    outputs = {}
+    image_variants = optimize_images(source_images_path, images_path, image_requests, manifest["images"])
+
+    # Image variants are written by the image stage, record them so stale ones get cleaned up
+    manifest["images"] = {k: v for k, v in manifest["images"].items() if k in image_variants}
+    for filename, info in image_variants.items():
+        for entries in list(info["sources"].values()) + [info["fallback"]]:
+            for name, _ in entries:
+                outputs[f"images/{name}"] = manifest["images"][filename]["key"]
+
+    placeholders = image_placeholders(source_images_path, image_variants, cache_path) if image_variants else {}
+
+    # --- ASSET PUBLISHING ---
+    trace.begin("asset publishing")
+    # Every referenced file is published under a content-hash name so it can be cached as immutable
+    asset_urls = {}
+    publish_methods = {}
+    published_images = [name for name in image_requests if name not in image_variants]
+    for subdir, src_dir, filenames in [("pdfs", source_pdfs_path, published_pdfs), ("images", source_images_path, published_images)]:
+        for filename in filenames:
+            src_file = os.path.join(src_dir, filename)
+            if not os.path.isfile(src_file):
+                continue
+            if subdir == "pdfs":
+                src_file = optimized_pdfs.get(filename, src_file)
+            relpath, method = publish_asset(src_file, base_path, subdir, previous_outputs, outputs, name=filename)
+            asset_urls[f"{subdir}/{filename}"] = relpath
+            publish_methods[method] = publish_methods.get(method, 0) + 1
+
+    unchanged = publish_methods.pop(None, 0)
+    methods = ", ".join(f"{count} {method}" for method, count in sorted(publish_methods.items()))
+    print(f"Assets: {len(asset_urls)} published ({methods or 'none new'}), {unchanged} unchanged")
+
+    # --- PAGES ---
+    trace.begin("page setup")
+    # Every project gets its own page; the listing shows compact cards, case_studies_per_page at a time
+    # casestudies.html rebuilds these names from the id to redirect old #<id> links; keep them in step
+    case_study_pages = {p["id"]: f"case-{p['id']}.html" for p in projects}
+    listing_chunks = [projects[i:i + case_studies_per_page] for i in range(0, len(projects), case_studies_per_page)] or [[]]
+    listing_pages = ["casestudies.html"] + [f"casestudies-{n}.html" for n in range(2, len(listing_chunks) + 1)]
+    listing_page_of = {p["id"]: listing_pages[i // case_studies_per_page] for i, p in enumerate(projects)}
+
+    page_jobs = []
+    for page in pages:
+        if page == "casestudies.html":
+            page_jobs += [(name, page, {"page_projects": chunk, "page_number": number, "listing_pages": listing_pages})
+                          for number, (name, chunk) in enumerate(zip(listing_pages, listing_chunks), 1)]
+        else:
+            page_jobs.append((page, page, {}))
+    page_jobs += [(case_study_pages[p["id"]], "casestudy.html", {"p": p, "listing_page": listing_page_of[p["id"]]})
+                  for p in projects]
+
+    # Postings are built once here; the search box loads them only when someone types
+    search_index, search_files = build_search_index(projects, case_study_pages)
+    print(f"Search: {len(search_files) - 1} shards ({sum(len(t.encode('utf-8')) for t in search_files.values()) / 1024:.1f} KB)")
+
+    page_assets = PageAssets(asset_urls, image_variants, image_slots, placeholders, eager_image_slots)
+    templates = TemplateRenderer(template_path, {
+        "user_name": user_name, "cv_da_pos": cv_da_pos, "cv_en_pos": cv_en_pos,
+        "hire_da_pos": hire_da_pos, "hire_en_pos": hire_en_pos,
+        "profile_image_index": profile_image_index, "profile_image_profile": profile_image_profile,
+        "cv_file": cv_file, "bsc_certificate_file": bsc_certificate_file, "tutor_certificate_file": tutor_certificate_file,
+        "linkedin_url": linkedin_url, "github_url": github_url,
+        "projects": projects, "featured_projects": featured_projects, "experiences": experiences,
+        "competencies": competencies_list, "nav_links": pages,
+        "case_study_pages": case_study_pages,
+        "eager_listing_thumbnails": eager_listing_thumbnails, "search_index": search_index, "search_tags": sorted({tag for p in projects for tag in p["tags"]}),
+        "get_picture": page_assets.picture, "asset_url": page_assets.url,
+        "FONT_PLACEHOLDER": FONT_PLACEHOLDER, "STYLESHEET_PLACEHOLDER": STYLESHEET_PLACEHOLDER,
+        "CRITICAL_CSS_PLACEHOLDER": CRITICAL_CSS_PLACEHOLDER, "SERVICE_WORKER_PLACEHOLDER": SERVICE_WORKER_PLACEHOLDER,
+    })
 
     # --- EXECUTION ---
+    trace.begin("rendering")
     os.makedirs(base_path, exist_ok=True)
+    # Earlier builds kept their caches in the output folder, where they were deployed with the site
+    shutil.rmtree(os.path.join(base_path, ".build-cache"), ignore_errors=True)
     os.makedirs(images_path, exist_ok=True)
     os.makedirs(pdfs_path, exist_ok=True)
 
-    files = {
-        "index.html": index_page,
-        "casestudies.html": casestudies_page,
-        "experience.html": experience_page,
-        "profile.html": profile_page,
-        "contact.html": contact_page
-    }
+    # Watch mode passes the same render_cache to every build and incremental builds keep theirs in
+    # the cache folder; a page whose input key is unchanged is reused instead of rendered again
+    persist_render_cache = render_cache is None and incremental
+    if persist_render_cache:
+        render_cache = load_render_cache(cache_path, (file_hash(os.path.abspath(__file__)), split_languages))
+    cached_pages = render_cache.get("pages", {}) if render_cache is not None else {}
+    stale_jobs = [
+        (page, template, params) for page, template, params in page_jobs
+        if page not in cached_pages or cached_pages[page][0] != templates.input_key(template, params, cached_pages[page][2], page_assets)
+    ]
+    # Separate /da/ and /en/ pages instead of shipping both languages and toggling them with JS
+    rendered = dict(zip((job[0] for job in stale_jobs), render_pages(templates, stale_jobs, split_languages, jobs)))
+    page_results = {page: rendered[page] if page in rendered else cached_pages[page][1:] for page, _, _ in page_jobs}
+    for page, template, _ in stale_jobs:
+        start_ns, end_ns, pid = rendered[page][2]
+        trace.add_event(page, "render", start_ns, end_ns, pid=pid, template=template)
+    if render_cache is not None:
+        render_cache["pages"] = {
+            page: cached_pages[page] if page not in rendered
+            else (templates.input_key(template, params, rendered[page][1], page_assets), *rendered[page])
+            for page, template, params in page_jobs
+        }
+        print(f"Pages: {len(stale_jobs)} rendered, {len(page_jobs) - len(stale_jobs)} unchanged")
+    files = {filename: html for variants, *_ in page_results.values() for filename, html in variants}
+    if split_languages:
+        files.update({page: language_redirect_page(page, "da") for page, _, _ in page_jobs})
+
+    # --- WEB FONTS ---
+    trace.begin("fonts")
+    # Subset each face to the characters the pages render; without them pages use the fallback fonts
+    font_sources = {(family, weight): find_font_source(source_fonts_path, family, weight)
+                    for family, weights in FONT_FAMILIES.items() for weight in weights}
+    missing_fonts = [f"{family} {weight}" for (family, weight), src in font_sources.items() if src is None]
+    font_css, font_preloads = "", None
+    fallback = "fonts are loaded from Google Fonts" if google_fonts_fallback else "pages use the system fallback fonts"
+    if subset is None:
+        print(f"NOTE: fontTools not installed, {fallback}.")
+    elif missing_fonts:
+        print(f"NOTE: no font files in fonts/ for {', '.join(missing_fonts)}, {fallback} (--fetch-fonts downloads them).")
+    else:
+        chars = page_characters(files.values())
+        font_format = "woff2" if brotli is not None else "woff"
+        font_preloads = []
+        font_bytes = 0
+        for (family, weight), src_file in font_sources.items():
+            key = hashlib.sha256(f"{file_hash(src_file)}|{chars}|{font_format}".encode("utf-8")).hexdigest()
+            relpath = f"fonts/{slugify(family)}-{weight}.{key[:10]}.{font_format}"
+            # The name fingerprints source and glyph set, so an existing file is already correct
+            if relpath in previous_outputs and os.path.exists(os.path.join(base_path, relpath)):
+                outputs[relpath] = previous_outputs[relpath]
+            else:
+                write_output(base_path, relpath, subset_font(src_file, chars), previous_outputs, outputs)
+            font_bytes += os.path.getsize(os.path.join(base_path, relpath))
+            font_css += (
+                f"@font-face{{font-family:'{family}';font-style:normal;font-weight:{weight};font-display:swap;"
+                f"src:url(../{relpath}) format('{font_format}');unicode-range:{unicode_range(chars)}}}"
+            )
+            if (family, weight) in FONT_PRELOADS:
+                font_preloads.append(f'<link rel="preload" href="{{prefix}}{relpath}" as="font" type="font/{font_format}" crossorigin>')
+        print(f"Fonts: {len(font_sources)} faces subset to {len(chars)} characters ({font_bytes / 1024:.1f} KB)")
+
+    def get_font_links(prefix):
+        if font_preloads is None:
+            return GOOGLE_FONT_LINKS if google_fonts_fallback else ""
+        return "".join(link.replace("{prefix}", prefix) for link in font_preloads)
+
+    # Compile only the utilities the pages use and link the result by content hash
+    trace.begin("stylesheet")
+    site_css = minify_style(templates.render("site.css"))
+    # The utilities only depend on the class names in the pages, so unchanged pages keep the last result
+    stylesheet_key = hashlib.sha256("\0".join([site_css, *files.values()]).encode("utf-8")).hexdigest()
+    cached_stylesheet = render_cache.get("stylesheet") if render_cache is not None else None
+    if cached_stylesheet and cached_stylesheet[0] == stylesheet_key:
+        _, stylesheet, unknown_classes = cached_stylesheet
+    else:
+        stylesheet, unknown_classes = compile_stylesheet(files.values(), site_css)
+        if render_cache is not None:
+            render_cache["stylesheet"] = (stylesheet_key, stylesheet, unknown_classes)
+    stylesheet = font_css + stylesheet
+    stylesheet_rules = parse_css_rules(stylesheet)
+    stylesheet_tokens = selector_tokens(stylesheet_rules)
+    critical_by_tokens = {}
+    stylesheet_name = f"site.{hashlib.sha256(stylesheet.encode('utf-8')).hexdigest()[:10]}.css"
+    print(f"Stylesheet: css/{stylesheet_name} ({len(stylesheet.encode('utf-8')) / 1024:.1f} KB)")
+    if unknown_classes:
+        print(f"NOTE: no CSS generated for unknown classes: {', '.join(unknown_classes)}")
+
+    trace.begin("writing")
+    written, skipped = [], []
+    for relpath, content in [(f"css/{stylesheet_name}", stylesheet)] + list(search_files.items()):
+        if write_output(base_path, relpath, content, previous_outputs, outputs):
+            written.append(relpath)
+        else:
+            skipped.append(relpath)
+
+    # A page is finished from its rendered HTML, the stylesheet, the font links and the minify flag;
+    # when those hash the same as last time and the output still holds the result, nothing is redone
+    finished_pages = render_cache.setdefault("finished", {}) if render_cache is not None else {}
+    finish_flags = f"{stylesheet_name}\0{get_font_links('')}\0{minify}"
+
+    def finish_page(filename, content):
+        start_ns = time.perf_counter_ns()
+        key = hashlib.sha256(f"{finish_flags}\0{content}".encode("utf-8")).hexdigest()
+        cached = finished_pages.get(filename)
+        if (cached and cached[0] == key and previous_outputs.get(filename) == cached[1]
+                and os.path.exists(os.path.join(base_path, filename))):
+            outputs[filename] = cached[1]
+            trace.add_event(filename, "write", start_ns, time.perf_counter_ns(), tid=threading.get_ident(), written=False)
+            return False, cached[2]
+        content, sizes = inline_page_assets(filename, content)
+        changed = write_output(base_path, filename, content, previous_outputs, outputs)
+        finished_pages[filename] = (key, outputs[filename], sizes)
+        trace.add_event(filename, "write", start_ns, time.perf_counter_ns(), tid=threading.get_ident(),
+                        bytes=len(content.encode("utf-8")), written=changed)
+        return changed, sizes
+
+    def inline_page_assets(filename, content):
+        depth_prefix = "../" * filename.count("/")
+        content = content.replace(STYLESHEET_PLACEHOLDER, f"{depth_prefix}css/{stylesheet_name}")
+        # Inlined rules resolve font URLs from the page instead of from css/
+        # Computed once per distinct set of styled names, which is once per layout rather than per page
+        tokens = frozenset(fold_tokens(content) & stylesheet_tokens)
+        if tokens not in critical_by_tokens:
+            critical_by_tokens[tokens] = critical_css(stylesheet_rules, tokens)
+        critical = critical_by_tokens[tokens].replace("url(../", f"url({depth_prefix}")
+        content = content.replace(CRITICAL_CSS_PLACEHOLDER, critical)
+        content = content.replace(FONT_PLACEHOLDER, get_font_links(depth_prefix))
+        content = content.replace(SERVICE_WORKER_PLACEHOLDER, f"{depth_prefix}{SERVICE_WORKER_FILE}").strip()
+        sizes = None
+        if minify:
+            before = len(content.encode("utf-8"))
+            content = minify_html(content)
+            sizes = (before, len(content.encode("utf-8")))
+        return content, sizes
 
-    for filename, content in files.items():
-        with open(os.path.join(base_path, filename), "w", encoding="utf-8") as f:
-            f.write(textwrap.dedent(content).strip())
+    # Writes overlap in threads; results come back in page order so the report stays stable
+    with ThreadPoolExecutor(jobs) as pool:
+        results = list(pool.map(finish_page, files.keys(), files.values()))
+    for filename, (changed, sizes) in zip(files, results):
+        if sizes:
+            before, after = sizes
+            print(f"Minify: {filename:<18} {before / 1024:6.1f} KB -> {after / 1024:6.1f} KB ({(1 - after / before) * 100:.0f}% smaller)")
+        (written if changed else skipped).append(filename)
+
+    # --- SERVICE WORKER ---
+    trace.begin("service worker")
+    # Only the variant each slot displays at the budget viewport is precached, in the format browsers
+    # prefer; other widths and formats are cached once fetched
+    image_files = {url for key, url in asset_urls.items() if key.startswith("images/")}
+    for filename, slot in image_uses:
+        if filename in image_variants:
+            info = image_variants[filename]
+            entries = next(iter(info["sources"].values()), info["fallback"])
+            image_files.add("images/" + srcset_choice(", ".join(f"{name} {w}w" for name, w in entries), image_slots[slot][1]))
+    precache = precache_list(base_path, outputs, image_files, precache_pdf_size_cap)
+    version = hashlib.sha256("\n".join(f"{relpath} {outputs[relpath]}" for relpath in precache).encode("utf-8")).hexdigest()[:10]
+    service_worker = templates.render(SERVICE_WORKER_FILE, precache=json.dumps(precache, ensure_ascii=False),
+                                      version=version, cache_prefix=SERVICE_WORKER_CACHE_PREFIX)
+    if write_output(base_path, SERVICE_WORKER_FILE, service_worker, previous_outputs, outputs):
+        written.append(SERVICE_WORKER_FILE)
+    else:
+        skipped.append(SERVICE_WORKER_FILE)
+    precache_bytes = sum(os.path.getsize(os.path.join(base_path, relpath)) for relpath in precache)
+    print(f"Service worker: {len(precache)} files precached ({precache_bytes / 1024:.1f} KB), cache {version}")
+
+    # --- PRECOMPRESSION ---
+    trace.begin("precompression")
+    # Brotli and gzip siblings for the static server; unchanged files keep their previous siblings
+    pending = []
+    for relpath in [r for r in outputs if r.endswith(COMPRESSIBLE_EXTENSIONS)]:
+        siblings = [relpath + suffix for suffix in COMPRESSION_SUFFIXES if relpath + suffix in previous_outputs]
+        if relpath in written or not all(os.path.exists(os.path.join(base_path, s)) for s in siblings):
+            pending.append(relpath)
+        else:
+            outputs.update({s: previous_outputs[s] for s in siblings})
+
+    # Watch rebuilds skip this; changed files lose their siblings until the next regular build
+    compressed = precompress_outputs(base_path, pending) if precompress else {}
+    raw_total, compressed_totals = 0, {suffix: 0 for suffix in COMPRESSION_SUFFIXES}
+    for relpath, (raw_size, sizes) in compressed.items():
+        raw_total += raw_size
+        for suffix, size in sizes.items():
+            outputs[relpath + suffix] = outputs[relpath]
+            compressed_totals[suffix] += size
+    if compressed:
+        totals = ", ".join(f"{suffix} {size / 1024:.1f} KB" for suffix, size in compressed_totals.items() if size)
+        print(f"Precompressed: {len(compressed)} files, {raw_total / 1024:.1f} KB -> {totals}")
+    if brotli is None and precompress:
+        print("NOTE: brotli not installed, only .gz siblings were written.")
+
+    # --- PAGE BUDGETS ---
+    trace.begin("budgets")
+    # Checked against what was just written; the build still completes and then fails below
+    budgets = load_budgets(os.path.join(source_path, BUDGETS_FILE)) if enforce_budgets else None
+    over_budget = []
+    if budgets is not None:
+        weights = {page: page_weight(base_path, page) for page in files}
+        for page, weight in weights.items():
+            limits = page_budget(budgets, page)
+            exceeded = [(limit, limits[limit]) for limit in BUDGET_LIMITS if limit in limits and weight[limit] > limits[limit]]
+            if exceeded:
+                over_budget.append(budget_report(page, weight, exceeded))
+        heaviest = max(weights, key=lambda page: weights[page]["bytes"])
+        print(f"Budgets: {len(weights)} pages checked, heaviest {heaviest} "
+              f"({weights[heaviest]['bytes'] / 1024:.1f} KB, {weights[heaviest]['requests']} requests)")
+
+    trace.begin("manifest")
+    removed = remove_stale_outputs(base_path, previous_outputs, outputs)
+    manifest["outputs"] = outputs
+    save_manifest(base_path, manifest)
+    if persist_render_cache:
+        render_cache["finished"] = {filename: finished_pages[filename] for filename in files}
+        save_render_cache(cache_path, render_cache)
+    trace.end()
+    _build_trace = None
+    if incremental:
+        print(f"Incremental: {len(written)} written, {len(skipped)} unchanged, {removed} stale removed")
+        if skipped:
+            print(f"  skipped: {', '.join(skipped)}")
+
+    # A build that fails its budgets still saves its trace; that is the run worth looking at
+    if trace_path:
+        output_sizes = {relpath: os.path.getsize(os.path.join(base_path, relpath)) for relpath in sorted(outputs)}
+        trace.save(trace_path, output_sizes)
+        print(trace.summary(output_sizes))
+        print(f"Trace: {trace_path}")
+
+    if over_budget:
+        raise SystemExit(f"ERROR: {len(over_budget)} page(s) over budget ({BUDGETS_FILE}):\n" + "\n".join(over_budget))
 
     print("-" * 60)
     print(f"SUCCESS: Website generated at: {base_path}")
     print("-" * 60)
+    return base_path, written
+
+# --- WATCH MODE ---
+# Rebuilds whenever content, templates, images, PDFs or fonts change and serves the output folder
+# with live reload. Render traces limit each rebuild to the pages that read what changed, and only
+# browsers showing a rewritten page reload.
+WATCH_DIRS = ("content", "content/projects", "content/experiences", "templates", "images", "pdfs", "fonts")
+WATCH_DEBOUNCE = 0.03  # editors often save in several writes; wait this long for the last one
+WATCH_POLL_INTERVAL = 0.1
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO, IN_DELETE = 0x8, 0x40, 0x80, 0x200
+LIVE_RELOAD_PATH = "/__live-reload"
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+LIVE_RELOAD_SCRIPT = """<script>
+(() => {
+    const socket = new WebSocket(`ws://${location.host}""" + LIVE_RELOAD_PATH + """`);
+    socket.onmessage = event => {
+        const path = location.pathname.endsWith('/') ? location.pathname + 'index.html' : location.pathname;
+        if (JSON.parse(event.data).some(page => path.endsWith('/' + page))) location.reload();
+    };
+    // The server restarts when portfolio.py changes; reload once it is back
+    socket.onclose = () => setTimeout(function retry() {
+        fetch(location.href, { method: 'HEAD' }).then(() => location.reload(), () => setTimeout(retry, 500));
+    }, 500);
+})();
+</script>"""
+
+# Replaces a production worker left over from an earlier visit, so pages always come from the server
+WATCH_SERVICE_WORKER = "self.addEventListener('install', () => self.skipWaiting());\n" \
+    "self.addEventListener('activate', event => event.waitUntil(self.registration.unregister()));\n"
+
+def is_watched_file(path, script_file):
+    name = os.path.basename(path)
+    # Build caches are dotfiles, editor swap and backup files end in ~ or .swp
+    if name.startswith(".") or name.endswith(("~", ".swp", ".swx")):
+        return False
+    # Next to the script only the script itself matters
+    return os.path.dirname(path) != os.path.dirname(script_file) or path == script_file
+
+class InotifyWatcher:
+    # Linux only; the kernel reports changes immediately instead of us rescanning folders
+    def __init__(self, paths):
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for path in paths:
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE)
+            if wd >= 0:
+                self.dirs[wd] = path
+
+    def wait(self, timeout=None):
+        # Changed paths, or an empty list once timeout seconds pass without events
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        data = os.read(self.fd, 1 << 16)
+        changed, offset = [], 0
+        while offset < len(data):
+            wd, _, _, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b"\0")
+            offset += 16 + length
+            if wd in self.dirs:
+                changed.append(os.path.join(self.dirs[wd], os.fsdecode(name)))
+        return changed
+
+class PollingWatcher:
+    # Fallback for systems without inotify: compares (mtime, size) of every file each interval
+    def __init__(self, paths):
+        self.paths = paths
+        self.snapshot = self.scan()
+
+    def scan(self):
+        files = {}
+        for path in self.paths:
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self.scan()
+            changed = [path for path in current.keys() | self.snapshot.keys() if current.get(path) != self.snapshot.get(path)]
+            self.snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(WATCH_POLL_INTERVAL if deadline is None else max(0, min(WATCH_POLL_INTERVAL, deadline - time.monotonic())))
+
+def make_watcher(paths):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    print("NOTE: inotify not available, watching by polling.")
+    return PollingWatcher(paths)
+
+def websocket_frame(text):
+    # Unfragmented text frame; the server only ever sends, so no masking
+    data = text.encode("utf-8")
+    if len(data) < 126:
+        header = struct.pack("!BB", 0x81, len(data))
+    elif len(data) < 1 << 16:
+        header = struct.pack("!BBH", 0x81, 126, len(data))
+    else:
+        header = struct.pack("!BBQ", 0x81, 127, len(data))
+    return header + data
+
+class LiveReloadHandler(SimpleHTTPRequestHandler):
+    def __init__(self, request, client_address, server):
+        super().__init__(request, client_address, server, directory=server.site_path)
+
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def send_text(self, text, content_type):
+        data = text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].split("#", 1)[0]
+        if path == LIVE_RELOAD_PATH and self.headers.get("Upgrade", "").lower() == "websocket":
+            return self.open_websocket()
+        if path == f"/{SERVICE_WORKER_FILE}":
+            return self.send_text(WATCH_SERVICE_WORKER, "text/javascript")
+        file_path = self.translate_path(path)
+        if path.endswith("/"):
+            file_path = os.path.join(file_path, "index.html")
+        if file_path.endswith(".html") and os.path.isfile(file_path):
+            with open(file_path, encoding="utf-8") as f:
+                html = f.read()
+            position = html.rfind("</body>")
+            position = len(html) if position < 0 else position
+            return self.send_text(html[:position] + LIVE_RELOAD_SCRIPT + html[position:], "text/html; charset=utf-8")
+        return super().do_GET()
+
+    def open_websocket(self):
+        key = self.headers.get("Sec-WebSocket-Key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+        self.send_response(101, "Switching Protocols")
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.wfile.flush()
+        self.server.clients.add(self.connection)
+        # Browsers send nothing but the close frame; block here until the connection goes away
+        try:
+            while self.connection.recv(4096):
+                pass
+        except OSError:
+            pass
+        finally:
+            self.server.clients.discard(self.connection)
+            self.close_connection = True
+
+class LiveReloadServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, site_path):
+        self.site_path = site_path
+        self.clients = set()
+        super().__init__(address, LiveReloadHandler)
+
+    def broadcast(self, message):
+        frame = websocket_frame(message)
+        for connection in list(self.clients):
+            try:
+                connection.sendall(frame)
+            except OSError:
+                self.clients.discard(connection)
+
+def watch_website(port=8000, **options):
+    script_file = os.path.abspath(__file__)
+    source_path = options.get("source_path") or os.path.dirname(script_file)
+    render_cache = {}
+    base_path, _ = build_website(incremental=True, render_cache=render_cache, precompress=False, enforce_budgets=False, **options)
+
+    server = LiveReloadServer(("127.0.0.1", port), base_path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    watcher = make_watcher([os.path.dirname(script_file)] + [os.path.join(source_path, d) for d in WATCH_DIRS])
+    print(f"Watch: serving http://127.0.0.1:{port}/ with live reload, press Ctrl+C to stop")
+
+    try:
+        while True:
+            changed = {path for path in watcher.wait() if is_watched_file(path, script_file)}
+            while more := watcher.wait(WATCH_DEBOUNCE):
+                changed.update(path for path in more if is_watched_file(path, script_file))
+            if not changed:
+                continue
+            if script_file in changed:
+                # Code and configuration changed; start over in a fresh process
+                print("Watch: portfolio.py changed, restarting")
+                server.server_close()
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+
+            start = time.perf_counter()
+            print(f"Watch: {', '.join(sorted(os.path.relpath(path, source_path) for path in changed))} changed")
+            try:
+                _, written = build_website(incremental=True, render_cache=render_cache, precompress=False,
+                                            enforce_budgets=False, **options)
+            except SystemExit as e:
+                # Broken content or templates are reported and the next save tries again
+                print(e)
+                continue
+            except Exception:
+                traceback.print_exc()
+                continue
+            pages = [relpath for relpath in written if relpath.endswith(".html")]
+            server.broadcast(json.dumps(pages))
+            print(f"Watch: rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms, {len(pages)} page(s) reloaded")
+    except KeyboardInterrupt:
+        server.shutdown()
 
 if __name__ == "__main__":
-    build_website()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the portfolio website.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="build into a stable folder and only rewrite outputs whose inputs changed")
+    parser.add_argument("--out", help="output folder (defaults to the Desktop or the current directory)")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="warn instead of failing when referenced images or PDFs do not exist")
+    parser.add_argument("--minify", action="store_true",
+                        help="collapse insignificant whitespace and strip comments from the generated pages")
+    parser.add_argument("--split-languages", action="store_true",
+                        help="render separate /da/ and /en/ pages instead of toggling languages with JavaScript")
+    parser.add_argument("--jobs", type=int, metavar="N",
+                        help=f"worker processes for rendering sites of {PARALLEL_RENDER_MIN_PAGES}+ pages and threads for writing pages (defaults to the CPU count)")
+    parser.add_argument("--source", metavar="DIR",
+                        help="folder with content/, templates/, images/, pdfs/ and fonts/ (defaults to this script's folder)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="folder for the PDF, placeholder and content caches (defaults to a per-user cache folder)")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="write per-stage and per-page timings as a Chrome trace (JSON) and print a summary")
+    parser.add_argument("--watch", action="store_true",
+                        help="rebuild incrementally on every change and serve the site with live reload")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="port for the --watch server (default 8000)")
+    parser.add_argument("--fetch-fonts", action="store_true",
+                        help="download the Inter and Space Grotesk source files into fonts/ before building")
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    options = dict(output_path=args.out, source_path=args.source, cache_path=args.cache_dir, allow_missing=args.allow_missing,
+                   minify=args.minify, split_languages=args.split_languages, jobs=args.jobs)
+    if args.fetch_fonts:
+        fetch_fonts(os.path.join(args.source or os.path.dirname(os.path.abspath(__file__)), "fonts"))
+    if args.watch:
+        watch_website(port=args.port, **options)
+    else:
+        build_website(incremental=args.incremental, trace_path=args.trace, **options)
\ No newline at end of file
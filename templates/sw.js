@@ -0,0 +1,35 @@
+// Generated by portfolio.py; the cache name changes whenever a precached file does
+const CACHE = '{{ cache_prefix }}{{ version }}';
+const PRECACHE = {{ precache }};
+// Hashed assets outside the precache (fonts, other image widths and formats, PDFs) are kept once fetched
+const RUNTIME = /\/(images|pdfs|fonts|css|search)\/[^/]+$/;
+
+self.addEventListener('install', event => {
+    event.waitUntil(caches.open(CACHE).then(cache => cache.addAll(PRECACHE)).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil(caches.keys()
+        .then(keys => Promise.all(keys
+            .filter(key => key.startsWith('{{ cache_prefix }}') && key !== CACHE)
+            .map(key => caches.delete(key))))
+        .then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== location.origin) return;
+    // Folder URLs are served by their index.html
+    const key = url.pathname.endsWith('/') ? new URL('index.html', url).href : request;
+
+    event.respondWith(caches.open(CACHE).then(cache => cache.match(key, { ignoreSearch: true }).then(cached => {
+        if (cached) return cached;
+        return fetch(request).then(response => {
+            if (response.ok && response.status === 200 && RUNTIME.test(url.pathname)) {
+                cache.put(request, response.clone());
+            }
+            return response;
+        });
+    })));
+});
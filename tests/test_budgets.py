@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_PATH)
+
+from benchmark import write_dataset
+
+
+def test_over_budget_build_still_writes_trace(tmp_path):
+    source, output, trace_file = tmp_path / "source", tmp_path / "site", tmp_path / "trace.json"
+    write_dataset(str(source), 3, 2, 4)
+    # No page fits in a single byte, so every page is over budget
+    (source / "budgets.json").write_text(json.dumps({"*": {"bytes": 1}}), encoding="utf-8")
+
+    result = subprocess.run([sys.executable, os.path.join(SCRIPT_PATH, "portfolio.py"), "--source", str(source),
+                             "--out", str(output), "--cache-dir", str(tmp_path / "cache"), "--trace", str(trace_file)],
+                            capture_output=True, text=True)
+
+    assert result.returncode != 0
+    assert "over budget" in result.stderr
+    with open(trace_file, encoding="utf-8") as f:
+        trace = json.load(f)
+    assert "budgets" in [stage["name"] for stage in trace["stages"]]
+    assert trace["outputs"]
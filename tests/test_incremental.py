@@ -0,0 +1,60 @@
+import json
+import os
+import subprocess
+import sys
+
+SCRIPT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_PATH)
+
+from benchmark import write_dataset
+from portfolio import MANIFEST_NAME, remove_stale_outputs, write_output
+
+
+def test_write_output_skips_unchanged_files(tmp_path):
+    current = {}
+    assert write_output(str(tmp_path), "a/page.html", "one", {}, current)
+    previous, current = current, {}
+    mtime = os.stat(tmp_path / "a" / "page.html").st_mtime_ns
+
+    assert not write_output(str(tmp_path), "a/page.html", "one", previous, current)
+    assert os.stat(tmp_path / "a" / "page.html").st_mtime_ns == mtime
+    assert write_output(str(tmp_path), "a/page.html", "two", previous, {})
+    assert (tmp_path / "a" / "page.html").read_text(encoding="utf-8") == "two"
+
+
+def test_stale_outputs_are_removed(tmp_path):
+    previous = {}
+    write_output(str(tmp_path), "old.html", "old", {}, previous)
+    write_output(str(tmp_path), "kept.html", "kept", {}, previous)
+    assert remove_stale_outputs(str(tmp_path), previous, {"kept.html": previous["kept.html"]}) == 1
+    assert sorted(os.listdir(tmp_path)) == ["kept.html"]
+
+
+def build(source, output, cache):
+    result = subprocess.run([sys.executable, os.path.join(SCRIPT_PATH, "portfolio.py"), "--source", str(source),
+                             "--out", str(output), "--cache-dir", str(cache), "--incremental"],
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_unchanged_build_renders_and_writes_nothing(tmp_path):
+    source, output, cache = tmp_path / "source", tmp_path / "site", tmp_path / "cache"
+    write_dataset(str(source), 3, 2, 4)
+    build(source, output, cache)
+    with open(output / MANIFEST_NAME, encoding="utf-8") as f:
+        outputs = json.load(f)["outputs"]
+
+    log = build(source, output, cache)
+    assert "Pages: 0 rendered" in log
+    assert "Incremental: 0 written" in log
+
+    # Only the pages that show the edited project are rendered again
+    project = next((source / "content" / "projects").iterdir())
+    record = json.loads(project.read_text(encoding="utf-8"))
+    record["title"] += " (revised)"
+    project.write_text(json.dumps(record), encoding="utf-8")
+    log = build(source, output, cache)
+    rendered = int(log.split("Pages: ")[1].split()[0])
+    assert 0 < rendered < len([p for p in outputs if p.endswith(".html")])
+    assert "(revised)" in (output / f"case-{record['id']}.html").read_text(encoding="utf-8")
@@ -0,0 +1,38 @@
+import os
+import sys
+
+SCRIPT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_PATH)
+
+from portfolio import render_language_variant
+
+PAGE = (
+    '<html><head></head><body>'
+    '<h1><span class="lang-da hidden">Hej</span><span class="lang-en hidden">Hi</span></h1>'
+    '<p class="lang-en hidden text-sm">English <b>only</b></p><p class="lang-da hidden">Kun dansk</p>'
+    '<button id="lang-da" onclick="setLang(\'da\')">DA</button>'
+    '<img src="images/a.png" srcset="images/a-1.png 400w, images/a-2.png 800w"><a href="#top">top</a>'
+    '</body></html>'
+)
+
+
+def test_keeps_one_language_and_unwraps_its_spans():
+    html = render_language_variant(PAGE, "en", "index.html")
+    assert "<h1>Hi</h1>" in html
+    assert '<p class="text-sm">English <b>only</b></p>' in html
+    assert "Hej" not in html and "Kun dansk" not in html
+    assert '<html lang="en" data-lang="en">' in html
+
+
+def test_head_links_the_alternates():
+    html = render_language_variant(PAGE, "da", "profile.html")
+    assert ('<link rel="alternate" hreflang="da" href="../da/profile.html">'
+            '<link rel="alternate" hreflang="en" href="../en/profile.html">'
+            '<link rel="alternate" hreflang="x-default" href="../profile.html"></head>') in html
+
+
+def test_toggle_becomes_link_and_asset_urls_move_up():
+    html = render_language_variant(PAGE, "en", "index.html")
+    assert '<a href="../da/index.html" hreflang="da" lang="da"' in html and ">DA</a>" in html
+    assert '<img src="../images/a.png" srcset="../images/a-1.png 400w, ../images/a-2.png 800w">' in html
+    assert '<a href="#top">top</a>' in html
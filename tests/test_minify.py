@@ -0,0 +1,35 @@
+import os
+import sys
+
+SCRIPT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_PATH)
+
+from portfolio import minify_html, minify_script, minify_style
+
+
+def test_whitespace_around_block_tags_is_dropped():
+    html = "<div>\n  <p>  some\n   text  </p>\n  <!-- note -->\n</div>\n"
+    assert minify_html(html) == "<div><p>some text</p></div>"
+
+
+def test_whitespace_around_inline_elements_is_kept_as_one_space():
+    html = "<div>\n  <p>text <img src=a.png> more</p>\n  <label>Name <input name=n></label>\n</div>"
+    assert minify_html(html) == "<div><p>text <img src=a.png> more</p><label>Name <input name=n></label></div>"
+
+
+def test_conditional_comments_are_kept():
+    assert minify_html("<!--[if IE]><p>old</p><![endif]-->") == "<!--[if IE]><p>old</p><![endif]-->"
+
+
+def test_pre_and_textarea_are_verbatim():
+    html = "<div>\n<pre>  a\n    b  </pre>\n<textarea>\n x  y\n</textarea>\n</div>"
+    assert minify_html(html) == "<div><pre>  a\n    b  </pre> <textarea>\n x  y\n</textarea></div>"
+
+
+def test_script_keeps_lines_for_semicolon_insertion():
+    assert minify_script("\n  // comment\n  let a = 1\n\n  let b = a // trailing\n") == "let a = 1\nlet b = a // trailing"
+    assert minify_html("<script>\n  // c\n  go()\n</script>") == "<script>go()</script>"
+
+
+def test_style_rules_are_compacted():
+    assert minify_style("/* x */\n.a ,\n.b {\n  color: red;\n  margin: 0 auto;\n}\n") == ".a,.b{color:red;margin:0 auto;}"
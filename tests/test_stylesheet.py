@@ -0,0 +1,38 @@
+import os
+import sys
+
+SCRIPT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_PATH)
+
+from portfolio import compile_stylesheet, tw_compile_class
+
+
+def test_utility_compiles_to_its_rule():
+    assert tw_compile_class("p-4") == ("", (0, 39, "p-4"), ".p-4{padding:1rem}")
+
+
+def test_variants_escape_the_selector_and_pick_the_screen():
+    screen, _, css = tw_compile_class("md:hover:text-stone-900")
+    assert screen == "md"
+    assert css == ".md\\:hover\\:text-stone-900:hover{color:#1c1917}"
+
+
+def test_unknown_classes_do_not_compile():
+    assert tw_compile_class("nope-x") is None
+    assert tw_compile_class("wobble:p-4") is None
+
+
+def test_stylesheet_holds_only_used_utilities():
+    stylesheet, unknown = compile_stylesheet(['<div class="p-4 md:hidden nope-x"></div>'])
+    assert ".p-4{padding:1rem}" in stylesheet
+    assert "@media (min-width:768px){.md\\:hidden{display:none}}" in stylesheet
+    assert ".p-8{" not in stylesheet
+    assert unknown == ["nope-x"]
+
+
+def test_hooks_and_script_classes():
+    page = '<div class="reveal p-4"></div><script>el.classList.add("opacity-0")</script>'
+    stylesheet, unknown = compile_stylesheet([page], ".reveal{opacity:0}")
+    # Classes toggled by scripts get their rules; hand-written hooks are not reported as unknown
+    assert ".opacity-0{opacity:0}" in stylesheet
+    assert unknown == []
@@ -0,0 +1,68 @@
+import os
+import sys
+
+import pytest
+
+SCRIPT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPT_PATH)
+
+from portfolio import PageAssets, TemplateRenderer, compile_template, traced
+
+
+def render_source(source, **context):
+    namespace = dict(context)
+    exec(compile_template(source, "test.html"), namespace)
+    return "".join(namespace["__out"])
+
+
+def test_expressions_are_evaluated_and_text_is_kept():
+    assert render_source("<h1>{{ title.upper() }}</h1> {{ n + 1 }}", title="Hej", n=1) == "<h1>HEJ</h1> 2"
+
+
+def test_block_lines_do_not_leave_blank_lines():
+    source = "<ul>\n{% for item in items %}\n<li>{{ item }}</li>\n{% endfor %}\n</ul>\n"
+    assert render_source(source, items=["a", "b"]) == "<ul>\n<li>a</li>\n<li>b</li>\n</ul>\n"
+
+
+def test_if_elif_else():
+    source = "{% if n > 1 %}many{% elif n == 1 %}one{% else %}none{% endif %}"
+    assert [render_source(source, n=n) for n in (2, 1, 0)] == ["many", "one", "none"]
+
+
+@pytest.mark.parametrize("source, message", [
+    ("{% for x in xs %}", "missing {% endfor %}"),
+    ("{% endif %}", "unexpected {% endif %}"),
+    ("{% if a %}{% endfor %}", "unexpected {% endfor %}"),
+])
+def test_unbalanced_blocks_are_rejected(source, message):
+    with pytest.raises(ValueError, match=message):
+        compile_template(source, "test.html")
+
+
+def test_include_renders_each_variant_once_and_is_traced(tmp_path):
+    (tmp_path / "page.html").write_text("{{ include('nav.html', active=active) }}|{{ title }}", encoding="utf-8")
+    (tmp_path / "nav.html").write_text("nav:{{ active }}:{{ site }}", encoding="utf-8")
+    templates = TemplateRenderer(str(tmp_path), {"site": "S", "title": "T", "unused": 1})
+
+    html, trace = traced(templates.render, "page.html", active="home")
+    templates.render("page.html", active="home")
+
+    assert html == "nav:home:S|T"
+    assert list(templates.fragments) == [("nav.html", (("active", "home"),))]
+    assert set(trace["templates"]) == {"page.html", "nav.html"}
+    assert set(trace["names"]) == {"site", "title"}
+
+
+def test_input_key_follows_what_the_page_read(tmp_path):
+    (tmp_path / "page.html").write_text("{{ title }}", encoding="utf-8")
+    assets = PageAssets({}, {}, {}, {}, set())
+    templates = TemplateRenderer(str(tmp_path), {"title": "T", "other": 1})
+    _, trace = traced(templates.render, "page.html")
+    key = templates.input_key("page.html", {}, trace, assets)
+
+    # A name the page never read does not change its key
+    assert TemplateRenderer(str(tmp_path), {"title": "T", "other": 2}).input_key("page.html", {}, trace, assets) == key
+    assert TemplateRenderer(str(tmp_path), {"title": "U", "other": 1}).input_key("page.html", {}, trace, assets) != key
+    assert templates.input_key("page.html", {"page": 2}, trace, assets) != key
+    (tmp_path / "page.html").write_text("<p>{{ title }}</p>", encoding="utf-8")
+    assert templates.input_key("page.html", {}, trace, assets) != key